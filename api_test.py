@@ -1,10 +1,22 @@
 import requests
+import requests_cache
 import logging
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Shared session so the test queries reuse one pooled connection to ArcGIS;
+# responses are cached on disk for an hour so repeat runs don't hit the API
+SESSION = requests_cache.CachedSession(
+    '.cache/api_test',
+    backend='sqlite',
+    expire_after=3600,
+    cache_control=True
+)
+SESSION.headers['Accept-Encoding'] = 'gzip, deflate'
+
 def test_api_connection():
     """Simple test to verify API accessibility"""
     url = "https://services3.arcgis.com/T4QMspbfLg3qTGWY/arcgis/rest/services/Historic_Geomac_Perimeters_Archive/FeatureServer/0/query"
@@ -20,7 +32,7 @@ def test_api_connection():
     
     try:
         print("Testing API connection...")
-        response = requests.get(url, params=params)
+        response = SESSION.get(url, params=params)
         response.raise_for_status()
         
         data = response.json()
@@ -52,7 +64,7 @@ def test_count_query():
     
     try:
         print("\nTesting count query...")
-        response = requests.get(url, params=params)
+        response = SESSION.get(url, params=params)
         response.raise_for_status()
         
         data = response.json()
@@ -81,7 +93,7 @@ def test_single_record():
     
     try:
         print("\nTesting single record retrieval...")
-        response = requests.get(url, params=params)
+        response = SESSION.get(url, params=params)
         response.raise_for_status()
         
         data = response.json()
@@ -102,20 +114,21 @@ def test_single_record():
 def main():
     print("=== NIFC API Test Suite ===\n")
     
-    # Test basic connection
-    if not test_api_connection():
-        print("Basic API connection test failed!")
-        return
-        
-    # Test count query
-    if not test_count_query():
-        print("Count query test failed!")
-        return
-        
-    # Test single record retrieval
-    if not test_single_record():
-        print("Single record test failed!")
-        return
+    # The three queries are independent, so run them concurrently over the
+    # shared session; wall-clock is then roughly one request's latency
+    tests = [
+        ("Basic API connection", test_api_connection),
+        ("Count query", test_count_query),
+        ("Single record", test_single_record)
+    ]
+    with ThreadPoolExecutor(max_workers=len(tests)) as ex:
+        futures = [ex.submit(test) for _, test in tests]
+        results = [future.result() for future in futures]
+    
+    for (name, _), passed in zip(tests, results):
+        if not passed:
+            print(f"{name} test failed!")
+            return
         
     print("\nAll tests completed successfully!")
 
@@ -1,11 +1,28 @@
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
 from pathlib import Path
 import logging
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from collections import Counter
 from tqdm import tqdm
+import io
 import os
 import json
+import re
+import time
+import gc
+import shutil
 
 logging.basicConfig(
     level=logging.DEBUG,  # Changed to DEBUG for more verbose output
@@ -13,6 +30,116 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Schema of the NIFC perimeter/incident columns used downstream. Reading only
+# these, with fixed dtypes, skips pandas' per-column inference and object
+# columns. FIRE_YEAR is a nullable int16 (years fit comfortably) because
+# incident rows may lack it.
+PERIM_DTYPES = {
+    'FIRE_YEAR': 'Int16',
+    'INCIDENT_NAME': 'string',
+    'STATE': 'category',
+    'FIRE_SIZE': 'float32'
+}
+PERIM_COLS = list(PERIM_DTYPES)
+
+# Low-cardinality text columns kept as categoricals in memory
+CATEGORY_COLS = ('STATE', 'INCIDENT_NAME', 'AGENCY', 'FIRE_CAUSE')
+
+# Byte progress bars repaint once 0.5 s have passed and another 1 MiB has
+# arrived (at least every 2 s), rather than on every buffered read
+PROGRESS_OPTIONS = {
+    'mininterval': 0.5,
+    'maxinterval': 2.0,
+    'miniters': 1 << 20,
+    'smoothing': 0.05
+}
+
+# Seconds a cached copy of the NIFC schema metadata is used without revalidating
+SCHEMA_MAX_AGE = 7 * 24 * 3600
+
+# Arrow equivalents of PERIM_DTYPES for pyarrow's CSV reader. STATE is read as
+# a dictionary so it arrives in pandas as a categorical.
+PERIM_ARROW_TYPES = {
+    'FIRE_YEAR': pa.int16(),
+    'INCIDENT_NAME': pa.string(),
+    'STATE': pa.dictionary(pa.int32(), pa.string()),
+    'FIRE_SIZE': pa.float32()
+}
+PERIM_CONVERT = pacsv.ConvertOptions(
+    include_columns=PERIM_COLS, column_types=PERIM_ARROW_TYPES
+)
+CSV_READ_OPTIONS = pacsv.ReadOptions(use_threads=True, block_size=8 << 20)
+
+# The combined dataset is stored as one Parquet directory per year
+# (hive-style ``FIRE_YEAR=2020/``) so per-year readers can prune the rest
+YEAR_PARTITIONING = ds.partitioning(
+    pa.schema([('FIRE_YEAR', pa.int16())]), flavor='hive'
+)
+
+
+def _year_mask(years, start_year, end_year):
+    """Arrow boolean mask of ``start_year <= years <= end_year``
+
+    Uses a single subtract and unsigned compare: years below the range wrap
+    around to large values. Missing years give nulls, which filters drop.
+    """
+    offset = pc.subtract(pc.cast(years, pa.int32()), start_year)
+    offset = pc.cast(offset, pa.uint16(), safe=False)
+    return pc.less_equal(offset, end_year - start_year)
+
+
+def _fsync(path):
+    """Flush a written file's contents to disk"""
+    with open(path, 'rb+') as f:
+        os.fsync(f.fileno())
+
+
+@contextmanager
+def _atomic_write(path):
+    """Yield a temporary sibling of ``path`` that replaces it once written
+
+    The temporary file (or dataset directory) is fsynced and renamed over
+    ``path`` only if the block completes, so an interrupted write never
+    leaves a truncated file to be reloaded on the next run.
+    """
+    tmp = path.with_name(path.name + '.tmp')
+    old = path.with_name(path.name + '.old')
+    for stale in (tmp, old):
+        if stale.is_dir():
+            shutil.rmtree(stale)
+        elif stale.exists():
+            stale.unlink()
+    
+    try:
+        yield tmp
+        if tmp.is_dir():
+            for part in tmp.rglob('*'):
+                if part.is_file():
+                    _fsync(part)
+            # A directory can't be renamed over a non-empty one, so move the
+            # previous copy aside first
+            if path.exists():
+                os.replace(path, old)
+            os.replace(tmp, path)
+            if old.exists():
+                shutil.rmtree(old)
+        else:
+            _fsync(tmp)
+            os.replace(tmp, path)
+    except BaseException:
+        if tmp.is_dir():
+            shutil.rmtree(tmp, ignore_errors=True)
+        elif tmp.exists():
+            tmp.unlink()
+        raise
+
+
+def _perim_to_pandas(table):
+    """Convert an Arrow perimeter/incident table to the PERIM_DTYPES schema"""
+    types = {pa.int16(): pd.Int16Dtype(), pa.string(): pd.StringDtype()}
+    return table.unify_dictionaries().to_pandas(types_mapper=types.get)
+
+
 class FireDataCollector:
     """Collects wildfire data from multiple sources"""
     
@@ -29,16 +156,209 @@ class FireDataCollector:
         }
         for dir_path in self.dirs.values():
             dir_path.mkdir(exist_ok=True)
+        
+        # Shared HTTP session so repeated calls to the same ArcGIS/MTBS hosts
+        # reuse pooled keep-alive connections instead of re-handshaking TLS
+        self.session = requests.Session()
+        retry = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504]
+        )
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=retry
+        ))
+        # Ask for every compression urllib3 can decode here (gzip/deflate,
+        # plus br/zstd when their decoders are installed)
+        self.session.headers.update({
+            'Accept-Encoding': make_headers(accept_encoding=True)['accept-encoding'],
+            'User-Agent': 'QUESST/1.0'
+        })
+
+    def _meta_path(self, path):
+        """Sidecar file holding the HTTP validators for a downloaded file"""
+        return path.with_name(path.name + '.meta.json')
+
+    def _conditional_headers(self, path, **params):
+        """Build If-None-Match/If-Modified-Since headers for a cached download
+
+        Validators are only sent when the cached file exists and was produced
+        with the same request parameters (e.g. year range), since the file on
+        disk is what gets reused on a 304.
+        """
+        meta_file = self._meta_path(path)
+        if not path.exists() or not meta_file.exists():
+            return {}
+
+        try:
+            with open(meta_file) as f:
+                meta = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable cache metadata {meta_file}: {e}")
+            return {}
+
+        if meta.get('params', {}) != params:
+            return {}
+
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+
+    def _save_validators(self, path, response, **params):
+        """Persist the ETag/Last-Modified of a completed download next to it"""
+        meta = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'content_length': response.headers.get('content-length'),
+            'params': params
+        }
+        with open(self._meta_path(path), 'w') as f:
+            json.dump(meta, f, indent=2)
+
+    def _optimize_dtypes(self, df):
+        """Downcast the known fire columns and log the memory saved
+
+        Columns are matched on their base name, so the ``_perimeter`` and
+        ``_incident`` copies from the join are covered too.
+        """
+        before = df.memory_usage(deep=True).sum()
+        for col in df.columns:
+            name = re.sub(r'_(perimeter|incident)$', '', col)
+            if name == 'FIRE_YEAR' and df[col].dtype == 'int64':
+                df[col] = pd.to_numeric(df[col], downcast='integer')
+            elif name == 'FIRE_SIZE' and df[col].dtype == 'float64':
+                df[col] = pd.to_numeric(df[col], downcast='float')
+            elif name in CATEGORY_COLS and df[col].dtype != 'category':
+                df[col] = df[col].astype('category')
+        after = df.memory_usage(deep=True).sum()
+        logger.debug(f"Downcast dtypes: {before / 1e6:.1f} MB -> {after / 1e6:.1f} MB")
+        return df
+
+    @staticmethod
+    def _decoded_size(response):
+        """Size of the decoded body for progress bars, if known
+
+        With a Content-Encoding, Content-Length is the compressed size while
+        the bars count decoded bytes, so no total is given.
+        """
+        if response.headers.get('Content-Encoding', 'identity') != 'identity':
+            return None
+        return int(response.headers.get('content-length', 0)) or None
+
+    def _stream_csv(self, response, desc, chunk_filter=None,
+                    chunk_size=1024 * 1024, **read_kwargs):
+        """Parse a streamed CSV response in chunks without staging it on disk
+
+        The socket is read through a ``chunk_size`` buffer and the progress bar
+        is throttled by ``PROGRESS_OPTIONS``. ``chunk_filter``, if
+        given, is applied to every parsed chunk before it is kept. Extra
+        keyword arguments are passed to ``pd.read_csv``.
+        """
+        response.raw.decode_content = True
+        total_size = self._decoded_size(response)
+        buffered = io.BufferedReader(response.raw, buffer_size=chunk_size)
+        
+        chunks = []
+        with tqdm.wrapattr(
+            buffered, 'read', total=total_size, desc=desc, **PROGRESS_OPTIONS
+        ) as raw:
+            reader = pd.read_csv(
+                raw, chunksize=200_000, low_memory=False, engine='c', **read_kwargs
+            )
+            for chunk in reader:
+                if chunk_filter is not None:
+                    chunk = chunk_filter(chunk)
+                chunks.append(chunk)
+        df = pd.concat(chunks, ignore_index=True)
+        
+        # Categoricals from different chunks concatenate to object dtype, so
+        # re-apply the requested schema to the combined frame
+        if 'dtype' in read_kwargs:
+            df = df.astype(read_kwargs['dtype'])
+        return df
+
+    def _stream_arrow_csv(self, response, desc, convert_options=PERIM_CONVERT,
+                          batch_filter=None):
+        """Parse a streamed CSV response with pyarrow's multithreaded reader
+
+        Used for sources with a known schema, since the Arrow reader fixes
+        column types from the first block. ``batch_filter``, if given, maps
+        each record batch to a boolean mask of the rows to keep.
+        """
+        response.raw.decode_content = True
+        total_size = self._decoded_size(response)
+        buffered = io.BufferedReader(
+            response.raw, buffer_size=CSV_READ_OPTIONS.block_size
+        )
+        
+        batches = []
+        with tqdm.wrapattr(
+            buffered, 'read', total=total_size, desc=desc, **PROGRESS_OPTIONS
+        ) as raw:
+            reader = pacsv.open_csv(
+                raw, read_options=CSV_READ_OPTIONS, convert_options=convert_options
+            )
+            for batch in reader:
+                if batch_filter is not None:
+                    batch = batch.filter(batch_filter(batch))
+                batches.append(batch)
+        return pa.Table.from_batches(batches, schema=reader.schema)
+
+    def _download(self, url, path, desc, parse, params=None, **cache_params):
+        """Conditionally fetch ``url`` and cache the parsed result at ``path``
+
+        ``parse(response, desc)`` turns the streamed response into a DataFrame,
+        which is saved as Parquet with the response validators. On a 304 the
+        cached file is returned instead. ``cache_params`` identify what the
+        cached file was built from (see ``_conditional_headers``).
+        """
+        headers = self._conditional_headers(path, **cache_params)
+        with self.session.get(url, params=params, stream=True, headers=headers) as r:
+            if r.status_code == 304:
+                print(f"{desc} unchanged, using cached copy")
+                return self._optimize_dtypes(pd.read_parquet(path))
+            r.raise_for_status()
+            df = self._optimize_dtypes(parse(r, desc))
+            with _atomic_write(path) as tmp:
+                df.to_parquet(tmp, compression='zstd', index=False)
+            self._save_validators(path, r, **cache_params)
+        return df
+
+    def _parse_perimeter_csv(self, response, desc, batch_filter=None):
+        """Parse a NIFC perimeter/incident CSV response into PERIM_DTYPES"""
+        return _perim_to_pandas(
+            self._stream_arrow_csv(response, desc, batch_filter=batch_filter)
+        )
 
     def test_nifc_connection(self):
         """Test NIFC data connection and get available fields"""
         print("\nTesting NIFC data connection...")
         url = "https://opendata.arcgis.com/datasets/nifc::public-wildland-fire-perimeters.json"
+        schema_file = self.data_dir / 'nifc_schema.json'
         
         try:
-            response = requests.get(url)
-            response.raise_for_status()
-            metadata = response.json()
+            # The schema changes rarely, so a copy under a week old is used as is
+            if schema_file.exists() and time.time() - schema_file.stat().st_mtime < SCHEMA_MAX_AGE:
+                with open(schema_file) as f:
+                    metadata = json.load(f)
+            else:
+                response = self.session.get(url, headers=self._conditional_headers(schema_file))
+                if response.status_code == 304:
+                    # Still current; reset the age so it is trusted for another week
+                    schema_file.touch()
+                    with open(schema_file) as f:
+                        metadata = json.load(f)
+                else:
+                    response.raise_for_status()
+                    metadata = response.json()
+                    with _atomic_write(schema_file) as tmp:
+                        tmp.write_bytes(response.content)
+                    self._save_validators(schema_file, response)
             
             print("\nAvailable fields:")
             for field in metadata.get('fields', []):
@@ -58,16 +378,13 @@ class FireDataCollector:
             'where': f'FIRE_YEAR = {year}',
             'outFields': '*'
         }
+        output_file = self.data_dir / f'fires_{year}.parquet'
         
         try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            
-            output_file = self.data_dir / f'fires_{year}.csv'
-            with open(output_file, 'wb') as f:
-                f.write(response.content)
-            
-            df = pd.read_csv(output_file)
+            df = self._download(
+                url, output_file, f"Fires {year}", self._parse_perimeter_csv,
+                params=params
+            )
             print(f"\nDownloaded {len(df)} records for {year}")
             print("\nSample data:")
             print(df.head())
@@ -77,108 +394,139 @@ class FireDataCollector:
             logger.error(f"Download failed: {e}")
             return None
 
-    def download_nifc_data(self, start_year=2000, end_year=None):
-        """Download NIFC fire perimeter and incident data"""
-        if end_year is None:
-            end_year = datetime.now().year
+    def _arcgis_query(self, base_url, params):
+        """Run one ArcGIS REST query and return its decoded JSON"""
+        r = self.session.get(base_url, params=params)
+        r.raise_for_status()
+        data = r.json()
+        if 'error' in data:
+            raise RuntimeError(f"ArcGIS query failed: {data['error']}")
+        return data
 
-        logger.info(f"Downloading NIFC data from {start_year} to {end_year}")
+    def _arcgis_pages(self, base_url, where, fields='*', page=2000,
+                      concurrency=8, desc=None):
+        """Fetch every record matching ``where`` as a DataFrame of attributes
+
+        The matching record count is queried first, so all page offsets are
+        known up front and up to ``concurrency`` pages are fetched at once
+        over the shared session. ``fields`` is a list of columns or ``'*'``.
+        """
+        columns = None if fields == '*' else list(fields)
+        params = {
+            'where': where,
+            'outFields': fields if columns is None else ','.join(columns),
+            'returnGeometry': 'false',
+            'f': 'json'
+        }
+        total = self._arcgis_query(
+            base_url, {'where': where, 'returnCountOnly': 'true', 'f': 'json'}
+        )['count']
+        
+        def fetch(offset):
+            data = self._arcgis_query(
+                base_url,
+                {**params, 'resultOffset': offset, 'resultRecordCount': page}
+            )
+            features = data.get('features', [])
+            # A server maxRecordCount below ``page`` would silently skip rows
+            if len(features) < min(page, total - offset) and data.get('exceededTransferLimit'):
+                raise RuntimeError(
+                    f"ArcGIS returned {len(features)} of {page} records; use a smaller page size"
+                )
+            pbar.update(len(features))
+            return [feature['attributes'] for feature in features]
+        
+        with tqdm(desc=desc, total=total, unit=' records') as pbar, \
+                ThreadPoolExecutor(max_workers=concurrency) as ex:
+            pages = list(ex.map(fetch, range(0, total, page)))
         
-        # Check for existing data
-        perimeter_file = self.dirs['nifc'] / 'fire_perimeters.csv'
-        incident_file = self.dirs['nifc'] / 'fire_incidents.csv'
+        return pd.DataFrame.from_records(
+            [record for records in pages for record in records], columns=columns
+        )
+
+    def _download_perimeters(self, start_year, end_year):
+        """Download fire perimeters for a year range from the FeatureServer"""
+        perimeter_file = self.dirs['nifc'] / 'fire_perimeters.parquet'
         
         try:
-            # Perimeter data
+            # Perimeter data, filtered server-side by year and paged through
+            # the FeatureServer query endpoint
             print("\nDownloading fire perimeter data...")
-            perimeter_url = "https://opendata.arcgis.com/datasets/nifc::public-wildland-fire-perimeters.csv"
-            
-            with requests.get(perimeter_url, stream=True) as r:
-                r.raise_for_status()
-                total_size = int(r.headers.get('content-length', 0))
-                
-                with open(perimeter_file, 'wb') as f, tqdm(
-                    desc="Perimeters",
-                    total=total_size,
-                    unit='iB',
-                    unit_scale=True
-                ) as pbar:
-                    for chunk in r.iter_content(chunk_size=8192):
-                        size = f.write(chunk)
-                        pbar.update(size)
-            
-            print("Loading and filtering perimeter data...")
-            df_perimeters = pd.read_csv(perimeter_file)
-            df_perimeters = df_perimeters[
-                (df_perimeters['FIRE_YEAR'] >= start_year) & 
-                (df_perimeters['FIRE_YEAR'] <= end_year)
-            ]
-            df_perimeters.to_csv(perimeter_file, index=False)
+            perimeter_url = "https://services3.arcgis.com/T4QMspbfLg3qTGWY/arcgis/rest/services/Historic_Geomac_Perimeters_Archive/FeatureServer/0/query"
+            df_perimeters = self._arcgis_pages(
+                perimeter_url,
+                f'FIRE_YEAR >= {start_year} AND FIRE_YEAR <= {end_year}',
+                fields=PERIM_COLS,
+                desc="Perimeters"
+            ).astype(PERIM_DTYPES)
+            df_perimeters = self._optimize_dtypes(df_perimeters)
+            with _atomic_write(perimeter_file) as tmp:
+                df_perimeters.to_parquet(tmp, compression='zstd', index=False)
             print(f"Saved {len(df_perimeters):,} perimeter records")
+            return df_perimeters
             
-            # Incident data
+        except Exception as e:
+            logger.error(f"Error downloading perimeter data: {e}")
+            # Try to load existing data if download fails
+            if perimeter_file.exists():
+                logger.info("Loading existing perimeter data...")
+                return self._optimize_dtypes(pd.read_parquet(perimeter_file))
+            raise
+
+    def _download_incidents(self, start_year, end_year):
+        """Download the incident CSV and keep only the requested years"""
+        incident_file = self.dirs['nifc'] / 'fire_incidents.parquet'
+        year_range = {'start_year': start_year, 'end_year': end_year}
+        
+        try:
             print("\nDownloading fire incident data...")
             incident_url = "https://opendata.arcgis.com/datasets/nifc::public-wildland-fire-locations.csv"
-            
-            with requests.get(incident_url, stream=True) as r:
-                r.raise_for_status()
-                total_size = int(r.headers.get('content-length', 0))
-                
-                with open(incident_file, 'wb') as f, tqdm(
-                    desc="Incidents",
-                    total=total_size,
-                    unit='iB',
-                    unit_scale=True
-                ) as pbar:
-                    for chunk in r.iter_content(chunk_size=8192):
-                        size = f.write(chunk)
-                        pbar.update(size)
-            
-            print("Loading and filtering incident data...")
-            df_incidents = pd.read_csv(incident_file)
-            df_incidents = df_incidents[
-                (df_incidents['FIRE_YEAR'] >= start_year) & 
-                (df_incidents['FIRE_YEAR'] <= end_year)
-            ]
-            df_incidents.to_csv(incident_file, index=False)
+            # Parse and filter the response as it arrives, rather than
+            # saving, re-reading and re-writing the whole file
+            df_incidents = self._download(
+                incident_url, incident_file, "Incidents",
+                lambda r, desc: self._parse_perimeter_csv(
+                    r, desc,
+                    batch_filter=lambda batch: _year_mask(
+                        batch['FIRE_YEAR'], start_year, end_year
+                    )
+                ),
+                **year_range
+            )
             print(f"Saved {len(df_incidents):,} incident records")
-            
-            return df_perimeters, df_incidents
+            return df_incidents
             
         except Exception as e:
-            logger.error(f"Error downloading NIFC data: {e}")
-            # Try to load existing data if download fails
-            if perimeter_file.exists() and incident_file.exists():
-                logger.info("Loading existing NIFC data...")
-                return pd.read_csv(perimeter_file), pd.read_csv(incident_file)
+            logger.error(f"Error downloading incident data: {e}")
+            if incident_file.exists():
+                logger.info("Loading existing incident data...")
+                return self._optimize_dtypes(pd.read_parquet(incident_file))
             raise
 
+    def download_nifc_data(self, start_year=2000, end_year=None):
+        """Download NIFC fire perimeter and incident data"""
+        if end_year is None:
+            end_year = datetime.now().year
+
+        logger.info(f"Downloading NIFC data from {start_year} to {end_year}")
+        
+        # The two sources are independent, so fetch them concurrently
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            perimeters = ex.submit(self._download_perimeters, start_year, end_year)
+            incidents = ex.submit(self._download_incidents, start_year, end_year)
+            return perimeters.result(), incidents.result()
+
     def download_mtbs_data(self):
         """Download MTBS burn severity data"""
         logger.info("Downloading MTBS burn severity data")
         
-        mtbs_file = self.dirs['mtbs'] / 'burn_severity.csv'
+        mtbs_file = self.dirs['mtbs'] / 'burn_severity.parquet'
         
         try:
             print("\nDownloading MTBS burn severity data...")
             mtbs_url = "https://www.mtbs.gov/api/resources/csv/burns/CONUS"
+            df_mtbs = self._download(mtbs_url, mtbs_file, "MTBS Data", self._stream_csv)
             
-            with requests.get(mtbs_url, stream=True) as r:
-                r.raise_for_status()
-                total_size = int(r.headers.get('content-length', 0))
-                
-                with open(mtbs_file, 'wb') as f, tqdm(
-                    desc="MTBS Data",
-                    total=total_size,
-                    unit='iB',
-                    unit_scale=True
-                ) as pbar:
-                    for chunk in r.iter_content(chunk_size=8192):
-                        size = f.write(chunk)
-                        pbar.update(size)
-            
-            print("Loading MTBS data...")
-            df_mtbs = pd.read_csv(mtbs_file)
             print(f"Saved {len(df_mtbs):,} MTBS records")
             return df_mtbs
             
@@ -186,57 +534,147 @@ class FireDataCollector:
             logger.error(f"Error downloading MTBS data: {e}")
             if mtbs_file.exists():
                 logger.info("Loading existing MTBS data...")
-                return pd.read_csv(mtbs_file)
+                return self._optimize_dtypes(pd.read_parquet(mtbs_file))
             raise
 
     def combine_datasets(self):
         """Combine and clean all downloaded datasets"""
         logger.info("Combining datasets...")
         
-        combined_file = self.dirs['combined'] / 'all_fire_data.csv'
+        combined_dir = self.dirs['combined'] / 'all_fire_data'
         
         # Check for existing combined data
-        if combined_file.exists():
+        if combined_dir.exists():
             print("\nFound existing combined dataset. Loading...")
-            return pd.read_csv(combined_file)
+            return self._optimize_dtypes(
+                self._combined_dataset(combined_dir).to_table().to_pandas()
+            )
         
         print("\nLoading individual datasets...")
         try:
-            df_perimeters = pd.read_csv(self.dirs['nifc'] / 'fire_perimeters.csv')
-            df_incidents = pd.read_csv(self.dirs['nifc'] / 'fire_incidents.csv')
-            df_mtbs = pd.read_csv(self.dirs['mtbs'] / 'burn_severity.csv')
+            # Only the join keys and summary columns are needed downstream.
+            # Perimeters are held in memory; incidents are streamed past them
+            # in batches so the two inputs and the output never coexist.
+            columns = ['FIRE_YEAR', 'INCIDENT_NAME', 'STATE', 'FIRE_SIZE']
+            incidents = pq.ParquetFile(self.dirs['nifc'] / 'fire_incidents.parquet')
+            mtbs_records = pq.ParquetFile(
+                self.dirs['mtbs'] / 'burn_severity.parquet'
+            ).metadata.num_rows
+            left = self._prepare_join_frame(pd.read_parquet(
+                self.dirs['nifc'] / 'fire_perimeters.parquet', columns=columns
+            ))
             
-            print(f"Loaded {len(df_perimeters):,} perimeters, {len(df_incidents):,} incidents, {len(df_mtbs):,} MTBS records")
+            print(f"Loaded {len(left):,} perimeters, {incidents.metadata.num_rows:,} incidents, {mtbs_records:,} MTBS records")
             
             print("Merging datasets...")
-            combined = pd.merge(
-                df_perimeters,
-                df_incidents,
-                on=['FIRE_YEAR', 'INCIDENT_NAME'],
-                how='outer',
-                suffixes=('_perimeter', '_incident')
-            )
+            # Join on (year, integer name code) rather than hashing strings.
+            # Codes index the perimeter names; incident names with no
+            # perimeter get -1 and so never match.
+            join_keys = ['FIRE_YEAR', 'NAME_CODE']
+            names = pd.Index(left['INCIDENT_NAME'].unique())
+            left['NAME_CODE'] = names.get_indexer(left['INCIDENT_NAME'])
+            left['_row'] = np.arange(len(left))
+            left = left.rename(columns={
+                'STATE': 'STATE_perimeter', 'FIRE_SIZE': 'FIRE_SIZE_perimeter'
+            })
+            matched = np.zeros(len(left), dtype=bool)
+            
+            # Matched and incident-only rows come from each batch; perimeters
+            # never matched are appended at the end, giving an outer join
+            chunks = []
+            right_cols = left.columns.drop('INCIDENT_NAME')
+            for batch in incidents.iter_batches(batch_size=200_000, columns=columns):
+                right = self._prepare_join_frame(batch.to_pandas())
+                right['NAME_CODE'] = names.get_indexer(right['INCIDENT_NAME'])
+                right = right.rename(columns={
+                    'STATE': 'STATE_incident', 'FIRE_SIZE': 'FIRE_SIZE_incident'
+                })
+                out = right.merge(left[right_cols], on=join_keys, how='left')
+                matched[out['_row'].dropna().to_numpy(dtype='int64')] = True
+                chunks.append(out.drop(columns=['NAME_CODE', '_row']))
+            chunks.append(left[~matched].drop(columns=['NAME_CODE', '_row']))
+            del left, matched, names
+            gc.collect()
+            
+            combined = pd.concat(chunks, ignore_index=True)
+            del chunks
+            gc.collect()
+            
+            # Both sources carry STATE and FIRE_SIZE; keep one value per fire
+            # for the summary, preferring the perimeter record
+            for col in ('STATE', 'FIRE_SIZE'):
+                combined[col] = combined[f'{col}_perimeter'].combine_first(
+                    combined[f'{col}_incident']
+                )
+            combined = self._optimize_dtypes(combined)
             
             print(f"Saving combined dataset with {len(combined):,} records...")
-            combined.to_csv(combined_file, index=False)
+            with _atomic_write(combined_dir) as tmp:
+                ds.write_dataset(
+                    pa.Table.from_pandas(combined, preserve_index=False),
+                    base_dir=tmp,
+                    format='parquet',
+                    partitioning=YEAR_PARTITIONING,
+                    file_options=ds.ParquetFileFormat().make_write_options(compression='zstd')
+                )
             
             return combined
             
         except Exception as e:
             logger.error(f"Error combining datasets: {e}")
-            if combined_file.exists():
+            if combined_dir.exists():
                 logger.info("Loading existing combined data...")
-                return pd.read_csv(combined_file)
+                return self._optimize_dtypes(
+                    self._combined_dataset(combined_dir).to_table().to_pandas()
+                )
             raise
 
-    def generate_summary(self, df):
-        """Generate summary statistics from the combined dataset"""
+    def _combined_dataset(self, path=None):
+        """Open the year-partitioned combined dataset without reading it"""
+        if path is None:
+            path = self.dirs['combined'] / 'all_fire_data'
+        return ds.dataset(path, format='parquet', partitioning=YEAR_PARTITIONING)
+
+    @staticmethod
+    def _prepare_join_frame(df):
+        """Drop rows without a year and normalise the join key columns"""
+        missing_year = df['FIRE_YEAR'].isna()
+        if missing_year.any():
+            logger.warning(f"Dropping {missing_year.sum():,} records without FIRE_YEAR")
+            df = df[~missing_year]
+        df = df.copy()
+        df['INCIDENT_NAME'] = df['INCIDENT_NAME'].astype(str)
+        df['FIRE_YEAR'] = df['FIRE_YEAR'].astype('int16')
+        return df
+
+    def generate_summary(self, path=None, batch_size=500_000):
+        """Generate summary statistics by streaming over the combined dataset
+
+        Counts and sums are folded one record batch at a time, so memory use
+        is bounded by ``batch_size`` rather than the size of the dataset.
+        """
+        totals = {'n': 0, 'acres': 0.0, 'sized': 0}
+        year_ctr, state_ctr = Counter(), Counter()
+        dataset = self._combined_dataset(path)
+        for batch in dataset.to_batches(
+            batch_size=batch_size, columns=['FIRE_YEAR', 'STATE', 'FIRE_SIZE']
+        ):
+            chunk = batch.to_pandas()
+            totals['n'] += len(chunk)
+            totals['acres'] += float(chunk['FIRE_SIZE'].sum())
+            totals['sized'] += int(chunk['FIRE_SIZE'].count())
+            year_ctr.update(chunk['FIRE_YEAR'].value_counts().to_dict())
+            # STATE comes back categorical, and value_counts lists every
+            # category; only states with fires are counted
+            states = chunk['STATE'].value_counts()
+            state_ctr.update(states[states > 0].to_dict())
+        
         summary = {
-            'total_fires': len(df),
-            'fires_by_year': df['FIRE_YEAR'].value_counts().sort_index(),
-            'fires_by_state': df['STATE'].value_counts(),
-            'total_acres_burned': df['FIRE_SIZE'].sum(),
-            'avg_fire_size': df['FIRE_SIZE'].mean()
+            'total_fires': totals['n'],
+            'fires_by_year': pd.Series(year_ctr, dtype='int64').sort_index(),
+            'fires_by_state': pd.Series(state_ctr, dtype='int64').sort_values(ascending=False),
+            'total_acres_burned': totals['acres'],
+            'avg_fire_size': totals['acres'] / totals['sized'] if totals['sized'] else float('nan')
         }
         
         # Save summary
@@ -269,18 +707,24 @@ def main():
     try:
         print("\n=== Starting Fire Data Collection ===")
         
-        # Download data from all sources
-        print("\nStep 1: Downloading NIFC Data")
-        perimeters, incidents = collector.download_nifc_data(start_year=2000)
-        
-        print("\nStep 2: Downloading MTBS Data")
-        mtbs_data = collector.download_mtbs_data()
+        # Download data from all sources concurrently; the downloads are
+        # I/O-bound and independent. Four workers keeps us under the
+        # per-host concurrency ArcGIS tolerates.
+        print("\nSteps 1-2: Downloading NIFC and MTBS Data")
+        start_year, end_year = 2000, datetime.now().year
+        with ThreadPoolExecutor(max_workers=4) as ex:
+            perimeters = ex.submit(collector._download_perimeters, start_year, end_year)
+            incidents = ex.submit(collector._download_incidents, start_year, end_year)
+            mtbs = ex.submit(collector.download_mtbs_data)
+            perimeters, incidents, mtbs_data = (
+                perimeters.result(), incidents.result(), mtbs.result()
+            )
         
         print("\nStep 3: Combining Datasets")
         combined_data = collector.combine_datasets()
         
         print("\nStep 4: Generating Summary")
-        summary = collector.generate_summary(combined_data)
+        summary = collector.generate_summary()
         
         # Print summary
         print("\n=== Data Collection Summary ===")
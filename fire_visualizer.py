@@ -1,11 +1,149 @@
 import folium
 from folium.plugins import HeatMap, TimestampedGeoJson
-import geopandas as gpd
 import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+import pyogrio
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 import numpy as np
-import pickle
+import orjson
+import io
+import gc
+
+# Shapefile fields used by the visualization
+FIRMS_COLUMNS = [
+    'ACQ_DATE', 'LATITUDE', 'LONGITUDE', 'BRIGHTNESS',
+    'SCAN', 'TRACK', 'CONFIDENCE', 'SATELLITE'
+]
+
+# Fixed pieces of the detection popup; per-fire values are joined in between
+POPUP_PARTS = (
+    "<div style='font-family: Arial; font-size: 12px;'><b>Fire Detection</b><br>Date: ",
+    "<br>Temperature: ",
+    "K<br>Area: ",
+    " km²<br>Satellite: ",
+    "</div>"
+)
+
+# Marker colours by intensity band: below 0.33, below 0.66, and above
+INTENSITY_BINS = [0.33, 0.66]
+INTENSITY_PALETTE = np.array(['#2196f3', '#ff9800', '#f44336'])
+
+# Columns kept in the processed checkpoint
+CHECKPOINT_COLUMNS = FIRMS_COLUMNS + ['datetime', 'year', 'month', 'ym']
+
+
+def _build_features(year, month, lat, lon, brightness, scan, track, fire_area,
+                    date_str, satellite_str, brightness_mean, brightness_std,
+                    bounds, seed):
+    """Build the encoded GeoJSON features for one month of detections
+
+    Runs in a worker process; the arrays hold just that month's rows.
+    """
+    rng = np.random.default_rng(seed)
+    idx = np.arange(len(lat))
+    features = []
+    
+    # Grid-based sampling for better regional representation
+    if len(idx) > 200:
+        # Create 20x20 grid of equal-width cells over the map bounds
+        lat_bin = np.minimum(19, (
+            (lat[idx] - bounds['south'])
+            / (bounds['north'] - bounds['south']) * 20
+        ).astype(np.int8))
+        lon_bin = np.minimum(19, (
+            (lon[idx] - bounds['west'])
+            / (bounds['east'] - bounds['west']) * 20
+        ).astype(np.int8))
+        cell = lat_bin.astype(np.int16) * 20 + lon_bin
+        
+        # Sample proportionally to fire intensity and size in each grid
+        # cell, 20% or at least 1 per cell. Weighted sampling without
+        # replacement uses Efraimidis-Spirakis keys log(u) / w: each
+        # cell keeps its rows with the largest keys.
+        weights = brightness[idx] * fire_area[idx]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sample_key = np.log(rng.random(len(idx))) / weights
+        sample_key = np.nan_to_num(sample_key, nan=-np.inf)
+        cell_size = np.bincount(cell, minlength=400)
+        per_cell = np.maximum(1, (cell_size * 0.2).astype(int))
+        
+        # Order by cell, then key descending; a row's rank in its cell
+        # is its position minus where the cell starts
+        order = np.lexsort((-sample_key, cell))
+        cell_start = np.concatenate(([0], np.cumsum(cell_size)[:-1]))
+        rank = np.arange(len(idx)) - cell_start[cell[order]]
+        idx = idx[order[rank < per_cell[cell[order]]]]
+    
+    # Skip fires with any critical value missing
+    idx = idx[~np.isnan(brightness[idx] + scan[idx] + track[idx])]
+    
+    # Calculate normalized intensity using z-score, clipped to ±2
+    # standard deviations and scaled to [0,1]
+    intensity = (brightness[idx] - brightness_mean) / brightness_std
+    intensity = (np.clip(intensity, -2, 2) + 2) / 4
+    
+    # Calculate actual fire radius in meters (from area), with a
+    # minimum of 0.01 km² to avoid zero area
+    area_km2 = np.maximum(0.01, scan[idx] * track[idx])
+    radius_meters = np.sqrt(area_km2 * 1_000_000 / np.pi)
+    
+    # Scale radius for visibility - 5-50 pixels
+    base_radius = np.clip(radius_meters / 1000, 5, 50)
+    
+    # Blue for cooler/smaller fires, orange for medium, red for intense
+    colors = INTENSITY_PALETTE[np.digitize(intensity, INTENSITY_BINS)]
+    
+    # Popup numbers are formatted for the whole month at once
+    temperature_str = np.char.mod('%.1f', brightness[idx])
+    area_str = np.char.mod('%.2f', area_km2)
+    prefix, temperature_label, area_label, satellite_label, suffix = POPUP_PARTS
+    
+    # Every feature in the month shares one time string
+    time_str = f"{int(year)}-{int(month):02d}-01"
+    
+    for lon_, lat_, color, radius, date, temperature, area, satellite in zip(
+        lon[idx].tolist(),
+        lat[idx].tolist(),
+        colors.tolist(),
+        base_radius.tolist(),
+        date_str[idx].tolist(),
+        temperature_str.tolist(),
+        area_str.tolist(),
+        satellite_str[idx].tolist()
+    ):
+        feature = {
+            'type': 'Feature',
+            'geometry': {
+                'type': 'Point',
+                'coordinates': [lon_, lat_]
+            },
+            'properties': {
+                'time': time_str,
+                'style': {
+                    'color': color,
+                    'fillColor': color,
+                    'fillOpacity': 0.6,
+                    'weight': 1,
+                    'radius': radius,
+                    'bubblingMouseEvents': True
+                },
+                'icon': 'circle',
+                'popup': "".join((
+                    prefix, date,
+                    temperature_label, temperature,
+                    area_label, area,
+                    satellite_label, satellite,
+                    suffix
+                ))
+            }
+        }
+        features.append(orjson.dumps(feature))
+    
+    return features
+
 
 class FireVisualizer:
     def __init__(self):
@@ -16,15 +154,35 @@ class FireVisualizer:
             'west': -170, # Include Alaska
             'east': -50   # Include eastern Canada
         }
-        self.checkpoint_file = Path("data/output/fire_data_processed.pkl")
+        self.checkpoint_file = Path("data/output/fire_data_processed.arrow")
+    
+    def _bounds_filter(self, shp):
+        """OGR SQL filter of ``shp`` rows to the map bounds
+        
+        Returns None (no pushdown; load_data's mask still applies) when the
+        coordinate fields are not numeric in the shapefile.
+        """
+        info = pyogrio.read_info(shp)
+        dtypes = dict(zip(info['fields'], info['dtypes']))
+        if not all(np.dtype(dtypes.get(col, object)).kind in 'if' for col in ('LATITUDE', 'LONGITUDE')):
+            return None
+        return (
+            f"LATITUDE >= {self.bounds['south']} AND LATITUDE <= {self.bounds['north']} AND "
+            f"LONGITUDE >= {self.bounds['west']} AND LONGITUDE <= {self.bounds['east']}"
+        )
     
     def load_data(self, data_dir="data/NASA", force_reload=False):
         """Load fire data, using checkpoint if available"""
         if not force_reload and self.checkpoint_file.exists():
             print("Loading from checkpoint...")
             try:
-                with open(self.checkpoint_file, 'rb') as f:
-                    self.data = pickle.load(f)
+                # Uncompressed Arrow IPC is memory-mapped, so numeric columns
+                # are paged in from the file rather than deserialized
+                table = feather.read_table(
+                    self.checkpoint_file, columns=CHECKPOINT_COLUMNS, memory_map=True
+                )
+                self.data = table.to_pandas(self_destruct=True)
+                del table
                 print(f"Loaded {len(self.data):,} fire records from checkpoint")
                 print(f"Date range: {self.data['datetime'].min():%Y-%m-%d} to {self.data['datetime'].max():%Y-%m-%d}")
                 return
@@ -51,23 +209,19 @@ class FireVisualizer:
         all_data = []
         for shp in selected_files:
             print(f"Reading {shp.name}...")
-            gdf = gpd.read_file(shp)
-            
-            # Basic data cleaning
-            gdf['datetime'] = pd.to_datetime(gdf['ACQ_DATE'])
-            gdf['year'] = gdf['datetime'].dt.year
-            gdf['month'] = gdf['datetime'].dt.month
-            
-            # Filter to North America and remove invalid coordinates
-            mask = (
-                (gdf['LATITUDE'] >= self.bounds['south']) & 
-                (gdf['LATITUDE'] <= self.bounds['north']) & 
-                (gdf['LONGITUDE'] >= self.bounds['west']) & 
-                (gdf['LONGITUDE'] <= self.bounds['east']) &
-                (gdf['LATITUDE'].notna()) & 
-                (gdf['LONGITUDE'].notna())
+            # Only the needed fields are read, and the bounds are applied by
+            # GDAL so just North American detections reach pandas. Nothing
+            # here is geometric, so geometries are never decoded; the bounds
+            # are therefore an attribute filter on LATITUDE/LONGITUDE, since a
+            # spatial bbox returns no rows when geometries are skipped on the
+            # Arrow read path.
+            gdf = pyogrio.read_dataframe(
+                shp,
+                read_geometry=False,
+                use_arrow=True,
+                columns=FIRMS_COLUMNS,
+                where=self._bounds_filter(shp)
             )
-            gdf = gdf[mask]
             
             # Clean numeric columns and remove invalid data
             numeric_cols = ['BRIGHTNESS', 'SCAN', 'TRACK', 'CONFIDENCE']
@@ -75,34 +229,59 @@ class FireVisualizer:
                 if col in gdf.columns:
                     gdf[col] = pd.to_numeric(gdf[col], errors='coerce')
             
-            # Remove rows with invalid measurements in critical columns
+            # Build one mask for all the row filters so the frame is copied
+            # once: North America bounds (NaN coordinates compare False),
+            # finite critical measurements, IQR outliers and positivity
             critical_cols = ['BRIGHTNESS', 'SCAN', 'TRACK']
-            gdf = gdf.dropna(subset=critical_cols)
+            lat = gdf['LATITUDE'].to_numpy(dtype=float)
+            lon = gdf['LONGITUDE'].to_numpy(dtype=float)
+            values = gdf[critical_cols].to_numpy(dtype=float)
+            mask = (
+                (lat >= self.bounds['south']) & 
+                (lat <= self.bounds['north']) & 
+                (lon >= self.bounds['west']) & 
+                (lon <= self.bounds['east']) &
+                np.isfinite(values).all(axis=1)
+            )
             
-            # Remove extreme outliers using IQR method
-            for col in critical_cols:
-                Q1 = gdf[col].quantile(0.25)
-                Q3 = gdf[col].quantile(0.75)
-                IQR = Q3 - Q1
-                lower_bound = Q1 - 1.5 * IQR
-                upper_bound = Q3 + 1.5 * IQR
-                gdf = gdf[
-                    (gdf[col] >= lower_bound) & 
-                    (gdf[col] <= upper_bound)
-                ]
+            # IQR bounds are taken over the rows that passed so far
+            if mask.any():
+                q1, q3 = np.quantile(values[mask], [0.25, 0.75], axis=0)
+                iqr = q3 - q1
+                mask &= (
+                    (values >= q1 - 1.5 * iqr) &
+                    (values <= q3 + 1.5 * iqr) &
+                    (values > 0)
+                ).all(axis=1)
+            gdf = gdf.loc[mask].copy()
             
-            # Additional validation
-            gdf = gdf[
-                (gdf['BRIGHTNESS'] > 0) &  # Temperature must be positive
-                (gdf['SCAN'] > 0) &        # Scan size must be positive
-                (gdf['TRACK'] > 0)         # Track size must be positive
-            ]
+            # Basic data cleaning
+            # FIRMS ACQ_DATE is ISO YYYY-MM-DD; an explicit format skips
+            # per-element format sniffing
+            gdf['datetime'] = pd.to_datetime(gdf['ACQ_DATE'], format='%Y-%m-%d', cache=True)
+            dt = gdf['datetime'].dt
+            gdf['year'] = dt.year.astype('int16')
+            gdf['month'] = dt.month.astype('int8')
+            # Single int32 month key (months since year 0) for grouping
+            gdf['ym'] = gdf['year'].astype('int32') * 12 + (gdf['month'].astype('int32') - 1)
             
             all_data.append(gdf)
         
         # Combine all data
+        # Free the per-file frames as soon as they are combined
         self.data = pd.concat(all_data, ignore_index=True)
-        self.data = self.data.sort_values('datetime')
+        all_data.clear()
+        gc.collect()
+        self.data = self.data.sort_values('datetime', kind='stable', ignore_index=True)
+        
+        # None of these need more than float32 precision
+        for col in ['LATITUDE', 'LONGITUDE', 'BRIGHTNESS', 'SCAN', 'TRACK', 'CONFIDENCE']:
+            if col in self.data.columns:
+                self.data[col] = self.data[col].astype('float32')
+        self.data['SATELLITE'] = self.data['SATELLITE'].astype('category')
+        
+        if self.data.empty:
+            raise ValueError(f"No fire records within the map bounds in {', '.join(f.name for f in selected_files)}")
         
         print(f"Loaded {len(self.data):,} fire records")
         print(f"Date range: {self.data['datetime'].min():%Y-%m-%d} to {self.data['datetime'].max():%Y-%m-%d}")
@@ -110,8 +289,11 @@ class FireVisualizer:
         # Save checkpoint
         print("Saving checkpoint...")
         self.checkpoint_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.checkpoint_file, 'wb') as f:
-            pickle.dump(self.data, f, protocol=4)
+        feather.write_feather(
+            pa.Table.from_pandas(self.data[CHECKPOINT_COLUMNS], preserve_index=False),
+            self.checkpoint_file,
+            compression='uncompressed'
+        )
         print("Checkpoint saved")
     
     def create_visualization(self, output_file="fire_visualization.html"):
@@ -136,7 +318,7 @@ class FireVisualizer:
             }
         ).add_to(m)
         
-        # Create features for each month
+        # Create features for each month, each encoded straight to JSON
         features = []
         print("Creating visualization features...")
         
@@ -145,89 +327,50 @@ class FireVisualizer:
         brightness_std = self.data['BRIGHTNESS'].std()
         
         # Calculate actual fire footprints in km²
-        self.data['fire_area'] = self.data['SCAN'] * self.data['TRACK']
+        self.data['fire_area'] = (self.data['SCAN'] * self.data['TRACK']).astype('float32')
         area_mean = self.data['fire_area'].mean()
         area_std = self.data['fire_area'].std()
         
-        for (year, month), month_data in self.data.groupby(['year', 'month']):
-            # Grid-based sampling for better regional representation
-            if len(month_data) > 200:
-                # Create 20x20 grid
-                month_data['lat_bin'] = pd.qcut(month_data['LATITUDE'], 20, labels=False)
-                month_data['lon_bin'] = pd.qcut(month_data['LONGITUDE'], 20, labels=False)
-                
-                # Sample proportionally to fire intensity and size in each grid cell
-                def smart_sample(group):
-                    n = min(len(group), max(1, int(len(group) * 0.2)))  # Sample 20% or at least 1
-                    weights = group['BRIGHTNESS'] * group['fire_area']
-                    return group.sample(n=n, weights=weights)
-                
-                month_data = month_data.groupby(['lat_bin', 'lon_bin']).apply(smart_sample)
-                month_data = month_data.reset_index(drop=True)
-            
-            for _, fire in month_data.iterrows():
-                # Skip if any critical values are NaN
-                if pd.isna(fire['BRIGHTNESS']) or pd.isna(fire['SCAN']) or pd.isna(fire['TRACK']):
-                    continue
-                
-                # Calculate normalized intensity using z-score
-                intensity = (fire['BRIGHTNESS'] - brightness_mean) / brightness_std
-                intensity = np.clip(intensity, -2, 2)  # Clip to ±2 standard deviations
-                intensity = (intensity + 2) / 4  # Normalize to [0,1]
-                
-                # Calculate actual fire radius in meters (from area)
-                area_km2 = max(0.01, fire['SCAN'] * fire['TRACK'])  # Minimum 0.01 km² to avoid zero area
-                radius_meters = np.sqrt(area_km2 * 1_000_000 / np.pi)  # Convert km² to m²
-                
-                # Scale radius for visibility - use smaller base size
-                base_radius = np.clip(radius_meters / 1000, 5, 50)  # Much smaller base size, 5-50 pixels
-                
-                # Color based on intensity and confidence
-                if intensity < 0.33:
-                    color = '#2196f3'  # blue for cooler/smaller fires
-                elif intensity < 0.66:
-                    color = '#ff9800'  # orange for medium fires
-                else:
-                    color = '#f44336'  # red for intense fires
-                
-                feature = {
-                    'type': 'Feature',
-                    'geometry': {
-                        'type': 'Point',
-                        'coordinates': [float(fire['LONGITUDE']), float(fire['LATITUDE'])]
-                    },
-                    'properties': {
-                        'time': f"{year}-{month:02d}-01",
-                        'style': {
-                            'color': color,
-                            'fillColor': color,
-                            'fillOpacity': 0.6,
-                            'weight': 1,
-                            'radius': base_radius,
-                            'bubblingMouseEvents': True
-                        },
-                        'icon': 'circle',
-                        'popup': (
-                            f"<div style='font-family: Arial; font-size: 12px;'>"
-                            f"<b>Fire Detection</b><br>"
-                            f"Date: {fire['ACQ_DATE']}<br>"
-                            f"Temperature: {fire['BRIGHTNESS']:.1f}K<br>"
-                            f"Area: {area_km2:.2f} km²<br>"
-                            f"Satellite: {fire['SATELLITE']}"
-                            f"</div>"
-                        )
-                    }
-                }
-                features.append(feature)
+        # Pull each column out once; months are then handled as index arrays
+        # into these rather than as per-group DataFrame copies
+        lat = self.data['LATITUDE'].to_numpy(dtype=float)
+        lon = self.data['LONGITUDE'].to_numpy(dtype=float)
+        brightness = self.data['BRIGHTNESS'].to_numpy(dtype=float)
+        scan = self.data['SCAN'].to_numpy(dtype=float)
+        track = self.data['TRACK'].to_numpy(dtype=float)
+        fire_area = self.data['fire_area'].to_numpy(dtype=float)
+        date_str = self.data['ACQ_DATE'].astype(str).to_numpy()
+        satellite_str = self.data['SATELLITE'].astype(str).to_numpy()
+        month_groups = self.data.groupby('ym', sort=True).indices
+        
+        # Months are independent, so their features are built in parallel
+        # worker processes, each given only its month's slices
+        seeds = np.random.SeedSequence().spawn(len(month_groups))
+        with ProcessPoolExecutor() as ex:
+            futures = [
+                ex.submit(
+                    _build_features, int(ym) // 12, int(ym) % 12 + 1,
+                    lat[idx], lon[idx], brightness[idx], scan[idx], track[idx],
+                    fire_area[idx], date_str[idx], satellite_str[idx],
+                    brightness_mean, brightness_std, self.bounds, seed
+                )
+                for (ym, idx), seed in zip(sorted(month_groups.items()), seeds)
+            ]
+            for future in futures:
+                features.extend(future.result())
         
         print(f"Created {len(features)} visualization features")
         
-        # Add the time slider with fire points
+        # Add the time slider with fire points. The collection is assembled
+        # from the encoded features and handed over as a file-like object,
+        # which folium embeds as is.
+        payload = (
+            b'{"type":"FeatureCollection","features":['
+            + b','.join(features)
+            + b']}'
+        )
         TimestampedGeoJson(
-            {
-                'type': 'FeatureCollection',
-                'features': features
-            },
+            io.StringIO(payload.decode()),
             period='P1M',
             duration='P15D',
             transition_time=300,  # Slightly longer transition for smoother animation
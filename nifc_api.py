@@ -1,5 +1,11 @@
+import orjson
+import pandas as pd
+import pyarrow as pa
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Union
 import logging
 
@@ -11,6 +17,21 @@ class NIFCApi:
         self.endpoint = "https://services3.arcgis.com/T4QMspbfLg3qTGWY/arcgis/rest/services/Public_Wildfire_Perimeters_View/FeatureServer/0"
         self.api_key = api_key
         self.logger = logging.getLogger(__name__)
+        
+        # One pooled session for all queries; the format and API key are sent
+        # as default parameters on every request
+        self.session = requests.Session()
+        self.session.params = {'f': 'json', 'token': api_key}
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504]
+        )
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=retry
+        ))
 
     def _make_request(
         self, 
@@ -19,20 +40,15 @@ class NIFCApi:
     ) -> Optional[Dict]:
         """Make a request to the API with error handling"""
         try:
-            # Add API key to parameters
-            params.update({
-                'f': 'json',
-                'token': self.api_key
-            })
-            
             url = f"{self.endpoint}/query" if is_query else self.endpoint
             self.logger.info(f"Making request to: {url}")
             self.logger.debug(f"Parameters: {params}")
             
-            response = requests.get(url, params=params)
+            response = self.session.get(url, params=params, timeout=30)
             response.raise_for_status()
             
-            data = response.json()
+            # orjson decodes the multi-MB feature pages much faster than json
+            data = orjson.loads(response.content)
             if 'error' in data:
                 self.logger.error(f"API Error: {data['error']}")
                 return None
@@ -42,6 +58,9 @@ class NIFCApi:
         except requests.exceptions.RequestException as e:
             self.logger.error(f"Request failed: {e}")
             return None
+        except orjson.JSONDecodeError as e:
+            self.logger.error(f"Invalid JSON response: {e}")
+            return None
 
     def get_yearly_summary(self, year: int) -> Optional[Dict]:
         """Get summary statistics for a specific year"""
@@ -75,8 +94,8 @@ class NIFCApi:
         fields: List[str] = None,
         limit: int = 1000,
         offset: int = 0
-    ) -> Optional[List[Dict]]:
-        """Get fire records for a specific year"""
+    ) -> Optional[pd.DataFrame]:
+        """Get fire records for a specific year as a typed DataFrame"""
         if fields is None:
             fields = [
                 'FIRE_YEAR', 'DISCOVERY_DATE', 'CONT_DATE',
@@ -94,7 +113,51 @@ class NIFCApi:
         }
         
         response = self._make_request(params)
-        return response.get('features', []) if response else None
+        if response is None:
+            return None
+        
+        # Build typed Arrow columns from the records in one pass
+        records = [feature['attributes'] for feature in response.get('features', [])]
+        if not records:
+            return pd.DataFrame(columns=fields)
+        return pa.Table.from_pylist(records).to_pandas(types_mapper=pd.ArrowDtype)
+
+    def get_record_count(self, year: int) -> Optional[int]:
+        """Get the number of fire records for a specific year"""
+        params = {
+            'where': f'FIRE_YEAR = {year}',
+            'returnCountOnly': 'true'
+        }
+        
+        response = self._make_request(params)
+        return response.get('count') if response else None
+
+    def get_all_fires(
+        self,
+        year: int,
+        fields: List[str] = None,
+        limit: int = 1000,
+        max_workers: int = 8
+    ) -> Optional[pd.DataFrame]:
+        """Get every fire record for a specific year
+        
+        The record count is fetched first so that all pages can be requested
+        concurrently; pages are returned in offset order.
+        """
+        count = self.get_record_count(year)
+        if count is None:
+            return None
+        
+        offsets = range(0, count, limit)
+        with ThreadPoolExecutor(max_workers=max_workers) as ex:
+            pages = list(ex.map(
+                lambda offset: self.get_fires(year, fields, limit, offset),
+                offsets
+            ))
+        
+        if any(page is None for page in pages):
+            return None
+        return pd.concat(pages, ignore_index=True) if pages else pd.DataFrame(columns=fields)
 
     def get_metadata(self) -> Optional[Dict]:
         """Get API metadata including available fields"""
@@ -1,14 +1,18 @@
 import pandas as pd
-import geopandas as gpd
 from pathlib import Path
 import os
 import logging
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 from tqdm import tqdm
-from shapely.geometry import Point
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 import json
-import pickle
+import hashlib
 
 # Set up logging
 logging.basicConfig(
@@ -20,6 +24,215 @@ logging.basicConfig(
     ]
 )
 
+# Dictionary to map various column names to standard names
+COLUMN_MAPPING = {
+    'latitude': 'latitude',
+    'longitude': 'longitude',
+    'LATITUDE': 'latitude',
+    'LONGITUDE': 'longitude',
+    'brightness': 'brightness',
+    'BRIGHTNESS': 'brightness',
+    'scan': 'scan',
+    'track': 'track',
+    'acq_date': 'date',
+    'ACQ_DATE': 'date',
+    'acq_time': 'time',
+    'ACQ_TIME': 'time',
+    'satellite': 'satellite',
+    'SATELLITE': 'satellite',
+    'instrument': 'instrument',
+    'INSTRUMENT': 'instrument',
+    'confidence': 'confidence',
+    'CONFIDENCE': 'confidence',
+    'version': 'version',
+    'VERSION': 'version',
+    'bright_t31': 'brightness_t31',
+    'frp': 'fire_radiative_power',
+    'FRP': 'fire_radiative_power',
+    'daynight': 'day_night',
+    'DAYNIGHT': 'day_night'
+}
+
+# Arrow types for the standardized columns. Columns whose contents differ
+# between sources (e.g. MODIS numeric vs VIIRS letter confidence) are read as
+# strings so files concatenate to one schema.
+STANDARD_TYPES = {
+    'latitude': pa.float32(),
+    'longitude': pa.float32(),
+    'brightness': pa.float32(),
+    'scan': pa.float32(),
+    'track': pa.float32(),
+    'brightness_t31': pa.float32(),
+    'fire_radiative_power': pa.float32(),
+    'date': pa.date32(),
+    'time': pa.int16(),
+    'satellite': pa.string(),
+    'instrument': pa.string(),
+    'confidence': pa.string(),
+    'version': pa.string(),
+    'day_night': pa.string()
+}
+
+# The same types keyed by the raw CSV column names
+CSV_COLUMN_TYPES = {
+    raw: STANDARD_TYPES[name]
+    for raw, name in COLUMN_MAPPING.items()
+    if name in STANDARD_TYPES
+}
+
+# Bump when the processing or aggregation logic changes so cached outputs
+# recorded in the manifest are rebuilt
+PIPELINE_VERSION = 1
+
+# CSVs larger than this are read through a memory map
+MEMORY_MAP_THRESHOLD = 100 << 20
+
+def _standardize_columns(table):
+    """Rename raw CSV columns of an Arrow table to the standard names"""
+    return table.rename_columns(
+        [COLUMN_MAPPING.get(name, name) for name in table.column_names]
+    )
+
+# What a cached ingest table depends on besides the CSV itself: the pipeline
+# version and how columns are selected, renamed and typed
+INGEST_SIGNATURE = json.dumps({
+    'version': PIPELINE_VERSION,
+    'columns': COLUMN_MAPPING,
+    'types': {name: str(dtype) for name, dtype in STANDARD_TYPES.items()}
+}, sort_keys=True)
+
+def _ingest_cache_path(file_path, cache_dir):
+    """Parquet cache location for a CSV
+    
+    Keyed on its path, mtime and size and on INGEST_SIGNATURE, so changing
+    the column mapping or schema (or bumping PIPELINE_VERSION) reparses.
+    """
+    file_path = Path(file_path)
+    stat = file_path.stat()
+    key = hashlib.blake2b(
+        f"{file_path.resolve()}:{stat.st_mtime_ns}:{stat.st_size}:{INGEST_SIGNATURE}".encode()
+    ).hexdigest()[:16]
+    return Path(cache_dir) / "ingest" / f"{key}.parquet"
+
+def _between(values, low, high):
+    """Element-wise ``low <= values <= high``; null where values are null"""
+    return pc.and_(pc.greater_equal(values, low), pc.less_equal(values, high))
+
+def _validate_table(table):
+    """Validate and clean one file's standardized Arrow table
+    
+    Runs per file, so the 99th-percentile thresholds are each file's own and
+    columns a source doesn't have (e.g. brightness for VIIRS) are simply
+    skipped. Every check lands in one mask and the table is filtered once.
+    """
+    original_len = table.num_rows
+    
+    # Rows with invalid (or missing) coordinates
+    keep = pc.and_(
+        _between(table['latitude'], -90, 90),
+        _between(table['longitude'], -180, 180)
+    )
+    
+    # Convert date and time to datetime
+    if 'date' in table.column_names:
+        # Seconds since the epoch as int64: days from the date32 column
+        # plus the HHMM time; missing or out-of-range times become null
+        seconds = pc.multiply(table['date'].cast(pa.int32()).cast(pa.int64()), 86400)
+        if 'time' in table.column_names:
+            hhmm = table['time'].cast(pa.int64())
+            hours = pc.divide(hhmm, 100)
+            minutes = pc.subtract(hhmm, pc.multiply(hours, 100))
+            valid = pc.and_(
+                pc.greater_equal(hhmm, 0),
+                pc.and_(pc.less(hours, 24), pc.less(minutes, 60))
+            )
+            seconds = pc.if_else(
+                valid,
+                pc.add(seconds, pc.add(pc.multiply(hours, 3600), pc.multiply(minutes, 60))),
+                pa.scalar(None, pa.int64())
+            )
+        table = table.append_column('datetime', seconds.cast(pa.timestamp('s')))
+        
+        # Rows with invalid dates or future dates: a plain int64
+        # comparison against the current wall-clock time in seconds
+        now = pa.scalar(pd.Timestamp.now().value // 10**9, pa.int64())
+        keep = pc.and_(keep, pc.less_equal(seconds, now))
+    
+    # Null entries (missing coordinates, invalid times) drop the row
+    keep = pc.fill_null(keep, False)
+    
+    # Remove extreme outliers (beyond 99th percentile) and missing values.
+    # Each threshold comes from the rows kept so far, as with filtering
+    # column by column; a column with no values in this file is left alone
+    numeric_columns = ['brightness', 'fire_radiative_power', 'brightness_t31']
+    for col in numeric_columns:
+        if col in table.column_names:
+            values = table[col]
+            kept = pc.drop_null(pc.filter(values, keep))
+            if len(kept) == 0:
+                continue
+            percentile_99 = pc.quantile(kept, q=0.99)[0]
+            keep = pc.and_(keep, pc.fill_null(pc.less_equal(values, percentile_99), False))
+    table = table.filter(keep)
+    
+    # Log if we removed any rows
+    rows_removed = original_len - table.num_rows
+    if rows_removed > 0:
+        logging.warning(f"Removed {rows_removed} invalid rows")
+        
+    return table
+
+def _read_fire_csv(file_path, cache_dir=None):
+    """Read a single CSV file into a standardized Arrow table
+    
+    Module-level so it can run in a worker process. Returns ``(table, error)``
+    with the validated table (None if no rows survive), so the parent
+    process keeps the statistics and error log. With a ``cache_dir`` the
+    standardized table is kept as Parquet and reused until the CSV changes;
+    validation always runs on it afterwards.
+    """
+    try:
+        cached = _ingest_cache_path(file_path, cache_dir) if cache_dir else None
+        if cached is not None and cached.exists():
+            table = _validate_table(pq.read_table(cached))
+            return (table if table.num_rows > 0 else None), None
+        
+        # Read only the columns we know how to standardize, with a fixed
+        # schema; large files are memory-mapped rather than buffered
+        with open(file_path, newline='', encoding='utf-8-sig') as f:
+            header = f.readline().strip().split(',')
+        include = [name for name in header if name in COLUMN_MAPPING]
+        convert_options = pacsv.ConvertOptions(
+            column_types=CSV_COLUMN_TYPES,
+            include_columns=include
+        )
+        source = file_path
+        if os.path.getsize(file_path) > MEMORY_MAP_THRESHOLD:
+            source = pa.memory_map(str(file_path), 'r')
+        try:
+            table = pacsv.read_csv(
+                source,
+                read_options=pacsv.ReadOptions(block_size=64 << 20),
+                convert_options=convert_options
+            )
+        finally:
+            if source is not file_path:
+                source.close()
+        table = _standardize_columns(table)
+        
+        if cached is not None:
+            # Write under a temporary name so a crashed run never leaves a
+            # truncated cache file behind
+            cached.parent.mkdir(parents=True, exist_ok=True)
+            tmp = cached.with_name(f"{cached.stem}.{os.getpid()}.tmp")
+            pq.write_table(table, tmp, compression='zstd')
+            os.replace(tmp, cached)
+        table = _validate_table(table)
+        return (table if table.num_rows > 0 else None), None
+        
+    except Exception as e:
+        return None, f"Error processing {file_path}: {str(e)}"
+
 class FireDataPreprocessor:
     def __init__(self, nasa_data_dir="data/NASA", output_dir="data/output"):
         self.nasa_data_dir = Path(nasa_data_dir)
@@ -44,6 +257,15 @@ class FireDataPreprocessor:
             'Summer': [6, 7, 8],
             'Fall': [9, 10, 11]
         }
+        
+        # Season name and season number (position in self.seasons) indexed by
+        # month number (index 0 unused)
+        self._season_names = list(self.seasons)
+        self._season_lut = np.array([''] * 13, dtype=object)
+        self._season_code_lut = np.zeros(13, dtype=np.int8)
+        for code, (season, months) in enumerate(self.seasons.items()):
+            self._season_lut[months] = season
+            self._season_code_lut[months] = code
     
     def get_season(self, month):
         """Get season name from month number"""
@@ -52,109 +274,90 @@ class FireDataPreprocessor:
                 return season
         return 'Winter'  # Default case
 
-    def standardize_columns(self, df):
-        """Standardize column names and formats across different data sources"""
-        # Dictionary to map various column names to standard names
-        column_mapping = {
-            'latitude': 'latitude',
-            'longitude': 'longitude',
-            'LATITUDE': 'latitude',
-            'LONGITUDE': 'longitude',
-            'brightness': 'brightness',
-            'BRIGHTNESS': 'brightness',
-            'scan': 'scan',
-            'track': 'track',
-            'acq_date': 'date',
-            'ACQ_DATE': 'date',
-            'acq_time': 'time',
-            'ACQ_TIME': 'time',
-            'satellite': 'satellite',
-            'SATELLITE': 'satellite',
-            'instrument': 'instrument',
-            'INSTRUMENT': 'instrument',
-            'confidence': 'confidence',
-            'CONFIDENCE': 'confidence',
-            'version': 'version',
-            'VERSION': 'version',
-            'bright_t31': 'brightness_t31',
-            'frp': 'fire_radiative_power',
-            'FRP': 'fire_radiative_power',
-            'daynight': 'day_night',
-            'DAYNIGHT': 'day_night'
-        }
-        
-        # Rename columns if they exist
-        df.rename(columns={k: v for k, v in column_mapping.items() if k in df.columns}, 
-                 inplace=True)
-        
-        return df
+    def standardize_columns(self, table):
+        """Standardize column names across different data sources"""
+        return _standardize_columns(table)
     
-    def validate_data(self, df):
-        """Validate and clean the data"""
-        original_len = len(df)
-        
-        # Convert coordinates to numeric
-        df['latitude'] = pd.to_numeric(df['latitude'], errors='coerce')
-        df['longitude'] = pd.to_numeric(df['longitude'], errors='coerce')
-        
-        # Remove rows with invalid coordinates
-        df = df[
-            df['latitude'].between(-90, 90) & 
-            df['longitude'].between(-180, 180)
-        ]
-        
-        # Convert date and time to datetime
-        if 'date' in df.columns:
-            if 'time' in df.columns:
-                # Combine date and time
-                df['datetime'] = pd.to_datetime(
-                    df['date'].astype(str) + ' ' + df['time'].astype(str).str.zfill(4),
-                    format='%Y-%m-%d %H%M',
-                    errors='coerce'
-                )
-            else:
-                df['datetime'] = pd.to_datetime(df['date'], errors='coerce')
-            
-            # Remove rows with invalid dates or future dates
-            df = df[
-                df['datetime'].notna() & 
-                (df['datetime'] <= pd.Timestamp.now())
-            ]
-        
-        # Convert and clean numeric columns
-        numeric_columns = ['brightness', 'fire_radiative_power', 'brightness_t31']
-        for col in numeric_columns:
-            if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors='coerce')
-                # Remove extreme outliers (beyond 99th percentile)
-                percentile_99 = np.percentile(df[col].dropna(), 99)
-                df = df[df[col] <= percentile_99]
-        
-        # Log if we removed any rows
-        rows_removed = original_len - len(df)
-        if rows_removed > 0:
-            logging.warning(f"Removed {rows_removed} invalid rows")
-            
-        return df
+    def validate_data(self, table):
+        """Validate and clean the data of one file (see _validate_table)"""
+        return _validate_table(table)
     
     def create_temporal_aggregations(self, df):
         """Create different temporal aggregations of the data"""
         logging.info("Creating temporal aggregations...")
         
-        # Extract temporal components
-        df['year'] = df['datetime'].dt.year
-        df['month'] = df['datetime'].dt.month
-        df['week'] = df['datetime'].dt.isocalendar().week
-        df['season'] = df['month'].map(self.get_season)
+        # Extract temporal components. They depend only on the day and the
+        # detections span a few thousand distinct days, so each field
+        # (including the ISO week) is computed once per day and broadcast
+        days, day_index = np.unique(
+            df['datetime'].to_numpy().astype('datetime64[D]'), return_inverse=True
+        )
+        calendar = pd.DatetimeIndex(days)
+        df['year'] = calendar.year.to_numpy().astype(np.int16)[day_index]
+        df['month'] = calendar.month.to_numpy().astype(np.int16)[day_index]
+        df['week'] = calendar.isocalendar().week.to_numpy().astype(np.int16)[day_index]
+        df['season'] = self._season_lut[df['month'].to_numpy()]
         
-        # Create period identifiers
-        df['yearly_period'] = df['year'].astype(str)
-        df['monthly_period'] = df['datetime'].dt.strftime('%Y-%m')
-        df['weekly_period'] = df['datetime'].dt.strftime('%Y-W%V')
-        df['seasonal_period'] = df['year'].astype(str) + '-' + df['season']
+        # Create period identifiers. Each is an integer key per row; only the
+        # distinct keys (a few hundred at most) are formatted as strings.
+        year = df['year'].to_numpy(dtype=np.int64)
+        month = df['month'].to_numpy(dtype=np.int64)
+        week = df['week'].to_numpy(dtype=np.int64)
+        season_code = self._season_code_lut[month]
+        names = self._season_names
+        df['yearly_period'] = self._period_labels(year, str)
+        df['monthly_period'] = self._period_labels(
+            year * 100 + month, lambda k: f"{k // 100}-{k % 100:02d}"
+        )
+        df['weekly_period'] = self._period_labels(
+            year * 100 + week, lambda k: f"{k // 100}-W{k % 100:02d}"
+        )
+        df['seasonal_period'] = self._period_labels(
+            year * 100 + season_code, lambda k: f"{k // 100}-{names[k % 100]}"
+        )
         
         return df
     
+    @staticmethod
+    def _period_labels(keys, fmt):
+        """Map integer period keys to a Categorical of labels
+        
+        Each distinct key is formatted once; categories are in sorted label
+        order so the codes can be reused directly as group codes.
+        """
+        uniques, inverse = np.unique(keys, return_inverse=True)
+        labels = np.array([fmt(int(key)) for key in uniques], dtype=object)
+        categories, relabel = np.unique(labels, return_inverse=True)
+        return pd.Categorical.from_codes(relabel[inverse], categories)
+    
+    @staticmethod
+    def _grouped_stats(codes, n_groups, values):
+        """NaN-skipping mean/min/max/count/sum of ``values`` per group code
+        
+        Matches pandas groupby semantics: missing values are ignored, groups
+        with no values get NaN for mean/min/max and 0 for count/sum. Mean,
+        min and max keep the dtype of ``values``; sums are float64.
+        """
+        valid = ~np.isnan(values) & (codes >= 0)
+        codes, values = codes[valid], values[valid]
+        
+        count = np.bincount(codes, minlength=n_groups)
+        total = np.bincount(codes, weights=values, minlength=n_groups)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.where(count > 0, total / count, np.nan).astype(values.dtype)
+        
+        # Sort by group so min/max are contiguous reduceat segments
+        minimum = np.full(n_groups, np.nan, dtype=values.dtype)
+        maximum = np.full(n_groups, np.nan, dtype=values.dtype)
+        if len(values):
+            order = np.argsort(codes, kind='stable')
+            codes, values = codes[order], values[order]
+            starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+            minimum[codes[starts]] = np.minimum.reduceat(values, starts)
+            maximum[codes[starts]] = np.maximum.reduceat(values, starts)
+        
+        return {'mean': mean, 'min': minimum, 'max': maximum, 'count': count, 'sum': total}
+    
     def create_aggregated_datasets(self, df):
         """Create and cache different aggregated versions of the dataset"""
         logging.info("Creating aggregated datasets...")
@@ -175,103 +378,173 @@ class FireDataPreprocessor:
             'fire_radiative_power': ['mean', 'min', 'max', 'sum']
         }
         
-        # Create and cache each aggregation
-        for agg_name, period_col in aggregations.items():
-            logging.info(f"Processing {agg_name} aggregation...")
-            
-            # Group and aggregate data
-            agg_df = df.groupby(period_col).agg(agg_metrics)
-            agg_df.columns = ['_'.join(col).strip() for col in agg_df.columns.values]
-            
-            # Reset index and add temporal components
-            agg_df = agg_df.reset_index()
-            
-            # Cache the aggregated data
-            cache_file = self.cache_dir / f"fire_data_{agg_name}.pkl"
-            with open(cache_file, 'wb') as f:
-                pickle.dump(agg_df, f, protocol=4)
-            
-            logging.info(f"Saved {agg_name} aggregation to {cache_file}")
-            
-            # Save a JSON metadata file for this aggregation
-            metadata = {
-                'period_type': agg_name,
-                'num_records': len(agg_df),
-                'columns': list(agg_df.columns),
-                'date_range': [agg_df[period_col].min(), agg_df[period_col].max()],
-                'created_at': datetime.now().isoformat()
-            }
-            
-            metadata_file = self.cache_dir / f"fire_data_{agg_name}_metadata.json"
-            with open(metadata_file, 'w') as f:
-                json.dump(metadata, f, indent=2)
+        # Every aggregation reads the same metric columns, so convert them
+        # once and share the arrays across the four period groupings. They
+        # are float32 from the CSV schema and stay that way; sums and means
+        # are still accumulated in float64 by bincount.
+        values = {col: df[col].to_numpy(dtype=np.float32) for col in agg_metrics}
+        
+        # The groupings are independent; NumPy sorts and Parquet writes
+        # release the GIL, so run them side by side
+        with ThreadPoolExecutor(max_workers=len(aggregations)) as ex:
+            futures = [
+                ex.submit(self._aggregate_period, agg_name, df[period_col], values, agg_metrics)
+                for agg_name, period_col in aggregations.items()
+            ]
+            for future in futures:
+                future.result()
+    
+    def _aggregate_period(self, agg_name, period, values, agg_metrics):
+        """Aggregate the metrics for one period type and cache the result"""
+        logging.info(f"Processing {agg_name} aggregation...")
+        period_col = period.name
+        
+        # Group and aggregate data: the period column is categorical, so its
+        # codes are the group codes and every metric is a NumPy grouped
+        # reduction over them (no string hashing)
+        if isinstance(period.dtype, pd.CategoricalDtype):
+            codes = period.cat.codes.to_numpy()
+            periods = np.asarray(period.cat.categories, dtype=object)
+        else:
+            codes, periods = pd.factorize(period, sort=True)
+        result = {period_col: periods}
+        for col, funcs in agg_metrics.items():
+            stats = self._grouped_stats(codes, len(periods), values[col])
+            for func in funcs:
+                result[f"{col}_{func}"] = stats[func]
+        agg_df = pd.DataFrame(result)
+        
+        # Metadata for this aggregation travels in the Parquet schema
+        metadata = {
+            'period_type': agg_name,
+            'num_records': len(agg_df),
+            'columns': list(agg_df.columns),
+            'date_range': [agg_df[period_col].min(), agg_df[period_col].max()],
+            'created_at': datetime.now().isoformat()
+        }
+        table = pa.Table.from_pandas(agg_df, preserve_index=False)
+        table = table.replace_schema_metadata({
+            **(table.schema.metadata or {}),
+            b'quesst_meta': json.dumps(metadata).encode()
+        })
+        
+        # Cache the aggregated data
+        cache_file = self.cache_dir / f"fire_data_{agg_name}.parquet"
+        pq.write_table(
+            table,
+            cache_file,
+            compression='zstd',
+            compression_level=3,
+            row_group_size=100_000,
+            use_dictionary=[period_col]
+        )
+        
+        logging.info(f"Saved {agg_name} aggregation to {cache_file}")
     
     def process_file(self, file_path):
-        """Process a single CSV file"""
-        try:
-            # Read CSV file
-            df = pd.read_csv(file_path)
-            
-            # Standardize columns
-            df = self.standardize_columns(df)
-            
-            # Validate data
-            df = self.validate_data(df)
-            
-            if len(df) > 0:
-                # Create GeoDataFrame
-                gdf = gpd.GeoDataFrame(
-                    df,
-                    geometry=gpd.points_from_xy(df.longitude, df.latitude),
-                    crs="EPSG:4326"
-                )
-                
-                self.stats['total_records'] += len(gdf)
-                self.stats['total_files_processed'] += 1
-                
-                return gdf
-            
-            return None
-            
-        except Exception as e:
-            error_msg = f"Error processing {file_path}: {str(e)}"
-            logging.error(error_msg)
-            self.stats['errors'].append(error_msg)
+        """Read a single CSV file into a standardized Arrow table"""
+        return self._record_result(*_read_fire_csv(file_path, self.cache_dir))
+    
+    def _record_result(self, table, error):
+        """Update the processing stats with one file's result"""
+        if error is not None:
+            logging.error(error)
+            self.stats['errors'].append(error)
             return None
+        if table is not None:
+            self.stats['total_files_processed'] += 1
+        return table
+    
+    @staticmethod
+    def _with_point_geometry(table):
+        """Append a ``geometry`` column of GeoArrow points to ``table``
+        
+        Points are stored as interleaved (lon, lat) pairs in a fixed-size
+        list, so readers get coordinates without a WKB parse. GeoArrow
+        coordinates are doubles, so the float32 columns are widened here.
+        """
+        coords = np.column_stack([
+            table['longitude'].to_numpy().astype(np.float64),
+            table['latitude'].to_numpy().astype(np.float64)
+        ]).ravel()
+        field = pa.field(
+            'geometry',
+            pa.list_(pa.field('xy', pa.float64(), nullable=False), 2),
+            metadata={
+                b'ARROW:extension:name': b'geoarrow.point',
+                b'ARROW:extension:metadata': json.dumps({'crs': 'EPSG:4326'}).encode()
+            }
+        )
+        geometry = pa.FixedSizeListArray.from_arrays(pa.array(coords), type=field.type)
+        return table.append_column(field, geometry)
     
     def process_data(self):
         """Process all CSV files and create aggregated datasets"""
         logging.info("Starting data preprocessing...")
         self.stats['start_time'] = datetime.now()
         
-        all_data = []
+        tables = []
         
         # Get all CSV files
         csv_files = list(self.nasa_data_dir.glob("**/*.csv"))
         logging.info(f"Found {len(csv_files)} CSV files")
         
-        # Process all files with progress bar
-        for file_path in tqdm(csv_files, desc="Processing CSV files"):
-            gdf = self.process_file(file_path)
-            if gdf is not None and len(gdf) > 0:
-                all_data.append(gdf)
+        # Nothing changed since the last successful run: reuse its output
+        manifest = self._manifest(csv_files)
+        if self._outputs_current(manifest):
+            logging.info("Inputs unchanged since last run; loading cached output")
+            output_file = self.output_dir / "fire_data.parquet"
+            table = pq.read_table(output_file).drop_columns(['geometry'])
+            return table.to_pandas(self_destruct=True, split_blocks=True)
+        
+        # Files are independent, so parse them across all cores; Arrow tables
+        # come back through the pool and are collected with a progress bar
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+            read = partial(_read_fire_csv, cache_dir=self.cache_dir)
+            results = ex.map(read, csv_files, chunksize=8)
+            for result in tqdm(results, total=len(csv_files), desc="Processing CSV files"):
+                table = self._record_result(*result)
+                if table is not None:
+                    tables.append(table)
         
-        if not all_data:
+        if not tables:
             raise ValueError("No data was successfully processed")
         
+        # Combine the validated Arrow tables (columns missing from a file
+        # become nulls) and convert to pandas once
         logging.info("Combining all processed data...")
-        combined_data = pd.concat(all_data, ignore_index=True)
+        combined = pa.concat_tables(tables, promote_options='default')
+        tables.clear()
+        
+        # Coordinates stay as plain float columns; nothing downstream needs
+        # point geometries, so none are built here
+        self.stats['total_records'] = combined.num_rows
         
         # Sort by datetime
-        if 'datetime' in combined_data.columns:
-            combined_data = combined_data.sort_values('datetime')
+        if 'datetime' in combined.column_names:
+            combined = combined.sort_by('datetime')
+        
+        # Validation and sorting stay columnar; pandas takes over from here.
+        # split_blocks keeps one block per column so self_destruct can free
+        # each Arrow column as it is converted instead of consolidating
+        combined_data = combined.to_pandas(
+            self_destruct=True, split_blocks=True, date_as_object=False
+        )
+        del combined
         
         # Create temporal aggregations
         combined_data = self.create_temporal_aggregations(combined_data)
         
-        # Save raw data
-        output_file = self.output_dir / "fire_data.csv"
-        combined_data.to_csv(output_file, index=False)
+        # Save raw data as Parquet with a GeoArrow point column, written one
+        # row group at a time
+        output_file = self.output_dir / "fire_data.parquet"
+        table = pa.Table.from_pandas(combined_data, preserve_index=False)
+        pq.write_table(
+            self._with_point_geometry(table),
+            output_file,
+            compression='zstd',
+            row_group_size=500_000
+        )
         
         # Create and cache aggregated datasets
         self.create_aggregated_datasets(combined_data)
@@ -304,8 +577,35 @@ class FireDataPreprocessor:
         
         if self.stats['errors']:
             logging.warning(f"Encountered {len(self.stats['errors'])} errors during processing")
+        else:
+            # Only a clean run is recorded, so failed files are retried
+            with open(self.cache_dir / "manifest.json", 'w') as f:
+                json.dump(manifest, f)
         
         return combined_data
+    
+    def _manifest(self, csv_files):
+        """Describe the current inputs by path, mtime and size (stat only)"""
+        files = {}
+        for path in sorted(csv_files):
+            stat = path.stat()
+            files[str(path)] = [stat.st_mtime_ns, stat.st_size]
+        return {'version': PIPELINE_VERSION, 'files': files}
+    
+    def _outputs_current(self, manifest):
+        """Whether the stored manifest matches and every output still exists"""
+        manifest_file = self.cache_dir / "manifest.json"
+        outputs = [self.output_dir / "fire_data.parquet"] + [
+            self.cache_dir / f"fire_data_{name}.parquet"
+            for name in ('seasonal', 'monthly', 'weekly', 'yearly')
+        ]
+        if not manifest_file.exists() or not all(path.exists() for path in outputs):
+            return False
+        try:
+            with open(manifest_file) as f:
+                return json.load(f) == manifest
+        except (OSError, ValueError):
+            return False
 
 def main():
     try:
@@ -4,8 +4,10 @@ setup(
     name="wildfires",
     version="0.1.0",
     packages=find_packages(),
+    package_data={'wildfires': ['templates/*.html']},
     install_requires=[
-        'pandas>=1.5.0',
+        'pandas>=2.0.0',
+        'pyarrow>=14.0.0',
         'geopandas>=0.12.0',
         'numpy>=1.23.0',
         'folium>=0.14.0',
@@ -13,9 +15,13 @@ setup(
         'shapely>=2.0.0',
         'pyproj>=3.4.0',
         'fiona>=1.9.0',
+        'pyogrio>=0.7.0',
         'tqdm>=4.65.0',
+        'orjson>=3.9.0',
+        'requests>=2.28.0',
         'matplotlib>=3.6.0',
         'seaborn>=0.12.0',
+        'requests-cache>=1.0.0',
         'jupyter>=1.0.0',
         'pytest>=7.3.0'
     ],
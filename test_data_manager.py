@@ -0,0 +1,72 @@
+"""
+Tests for DataManager loading and cleaning
+"""
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import pytest
+from shapely.geometry import Point
+from wildfires.data_manager import DataManager, _read_shapefile
+
+def _write_shapefile(path, confidence, lat, lon):
+    n = len(confidence)
+    gpd.GeoDataFrame({
+        'LATITUDE': lat,
+        'LONGITUDE': lon,
+        'BRIGHTNESS': np.linspace(300.0, 330.0, n),
+        'SCAN': np.ones(n),
+        'TRACK': np.ones(n),
+        'ACQ_DATE': ['2021-07-01'] * n,
+        'CONFIDENCE': confidence,
+        'SATELLITE': ['T'] * n
+    }, geometry=[Point(x, y) for x, y in zip(lon, lat)], crs="EPSG:4326").to_file(path)
+
+def test_read_shapefile_applies_bounds(tmp_path):
+    """Rows outside the bounds are filtered in the read, the rest all come back"""
+    path = tmp_path / "modis.shp"
+    _write_shapefile(path, [80, 55, 90], [45.0, 46.0, 10.0], [-110.0, -171.0, -110.0])
+
+    df, error = _read_shapefile(path, (-170, 25, -50, 70))
+    assert error is None
+    assert df['LATITUDE'].tolist() == [45.0]
+    assert 'geometry' not in df.columns
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    """DataManager over a temporary directory, without fetching state boundaries"""
+    monkeypatch.setattr(DataManager, '_load_states_data', lambda self: None)
+    return DataManager(data_dir=tmp_path / "NASA", output_dir=tmp_path / "processed")
+
+def test_load_raw_data_caches_mixed_confidence(manager):
+    """MODIS numeric and VIIRS letter confidence load and cache together"""
+    manager.data_dir.mkdir()
+    _write_shapefile(manager.data_dir / "modis.shp", [80, 55, 90], [45.0, 46.0, 47.0], [-110.0] * 3)
+    _write_shapefile(manager.data_dir / "viirs.shp", ['n', 'h', 'l'], [40.0, 41.0, 42.0], [-120.0] * 3)
+
+    manager.load_raw_data(force_reload=True)
+    assert len(manager.raw_data) == 6
+    assert (manager.cache_dir / "raw_data.parquet").exists()
+
+    cached = DataManager(data_dir=manager.data_dir, output_dir=manager.output_dir)
+    cached.load_raw_data()
+    assert sorted(cached.raw_data['CONFIDENCE']) == sorted(['80', '55', '90', 'n', 'h', 'l'])
+
+    manager.clean_data()
+    assert manager.processed_data['CONFIDENCE'].notna().sum() == 3
+
+def test_clean_data_with_no_rows_in_bounds(manager):
+    """Cleaning data with nothing in North America gives an empty frame"""
+    manager.raw_data = pd.DataFrame({
+        'LATITUDE': [10.0, -5.0],
+        'LONGITUDE': [20.0, 30.0],
+        'BRIGHTNESS': [300.0, 310.0],
+        'SCAN': [1.0, 1.0],
+        'TRACK': [1.0, 1.0],
+        'ACQ_DATE': ['2021-07-01', '2021-07-02'],
+        'CONFIDENCE': [80, 90],
+        'SATELLITE': ['T', 'A']
+    })
+    manager.clean_data()
+    assert len(manager.processed_data) == 0
+    assert 'season' in manager.processed_data.columns
@@ -43,11 +43,10 @@ class TestDataQuality(unittest.TestCase):
             limit=10
         )
         
-        if not fires:
+        if fires is None or fires.empty:
             self.fail("Could not retrieve fire data")
             
-        # Convert to DataFrame for easier analysis
-        df = pd.DataFrame([f['attributes'] for f in fires])
+        df = fires
         
         # Check for missing values
         missing_stats = df.isnull().sum()
@@ -71,10 +70,10 @@ class TestDataQuality(unittest.TestCase):
             limit=10
         )
         
-        if not fires:
+        if fires is None or fires.empty:
             self.fail("Could not retrieve fire data")
             
-        df = pd.DataFrame([f['attributes'] for f in fires])
+        df = fires
         
         # Convert epoch timestamps to datetime
         for date_col in ['DISCOVERY_DATE', 'CONT_DATE']:
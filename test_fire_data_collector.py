@@ -0,0 +1,72 @@
+"""
+Tests for the fire_data_collector file and filter helpers
+"""
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pytest
+from fire_data_collector import YEAR_PARTITIONING, FireDataCollector, _atomic_write, _year_mask
+
+def test_year_mask_matches_range_check():
+    """The unsigned-offset mask equals start <= year <= end, nulls dropped"""
+    years = pa.array([None, 0, 1, 1899, 1900, 1901, 1999, 2000, 2023, 2024, 2025, 3000, 32767], pa.int16())
+    mask = _year_mask(years, 1900, 2024)
+
+    values = years.to_numpy(zero_copy_only=False)
+    expected = [None] + ((values[1:] >= 1900) & (values[1:] <= 2024)).tolist()
+    assert mask.to_pylist() == expected
+    assert years.filter(mask).to_pylist() == [1900, 1901, 1999, 2000, 2023, 2024]
+
+def test_atomic_write_replaces_file(tmp_path):
+    """A completed block replaces the file and leaves no temporary behind"""
+    path = tmp_path / "data.parquet"
+    path.write_text("old")
+    with _atomic_write(path) as tmp:
+        tmp.write_text("new")
+        assert path.read_text() == "old"
+    assert path.read_text() == "new"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["data.parquet"]
+
+def test_atomic_write_keeps_old_file_on_error(tmp_path):
+    """An interrupted block leaves the previous file untouched"""
+    path = tmp_path / "data.parquet"
+    path.write_text("old")
+    with pytest.raises(RuntimeError):
+        with _atomic_write(path) as tmp:
+            tmp.write_text("partial")
+            raise RuntimeError("interrupted")
+    assert path.read_text() == "old"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["data.parquet"]
+
+def test_atomic_write_replaces_directory(tmp_path):
+    """Dataset directories are swapped whole, the previous copy removed"""
+    path = tmp_path / "dataset"
+    (path / "FIRE_YEAR=2020").mkdir(parents=True)
+    (path / "FIRE_YEAR=2020" / "part-0.parquet").write_text("old")
+    with _atomic_write(path) as tmp:
+        (tmp / "FIRE_YEAR=2021").mkdir(parents=True)
+        (tmp / "FIRE_YEAR=2021" / "part-0.parquet").write_text("new")
+    assert [p.name for p in path.iterdir()] == ["FIRE_YEAR=2021"]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["dataset"]
+
+def test_summary_lists_only_states_with_fires(tmp_path, monkeypatch):
+    """Unused STATE categories don't show up in the summary with zero fires"""
+    monkeypatch.chdir(tmp_path)
+    collector = FireDataCollector()
+    df = pd.DataFrame({
+        'FIRE_YEAR': pd.array([2020, 2020, 2021], dtype='int16'),
+        'STATE': pd.Categorical(['CA', 'CA', 'OR'], categories=['CA', 'NV', 'OR']),
+        'FIRE_SIZE': [1.0, 2.0, 3.0]
+    })
+    ds.write_dataset(
+        pa.Table.from_pandas(df, preserve_index=False),
+        collector.dirs['combined'] / 'all_fire_data',
+        format='parquet',
+        partitioning=YEAR_PARTITIONING
+    )
+
+    summary = collector.generate_summary()
+    assert summary['fires_by_state'].to_dict() == {'CA': 2, 'OR': 1}
+    assert summary['fires_by_year'].to_dict() == {2020: 2, 2021: 1}
+    assert 'NV' not in (collector.dirs['combined'] / 'summary.txt').read_text()
@@ -0,0 +1,45 @@
+"""
+Tests for loading FIRMS shapefiles in fire_visualizer.py
+"""
+
+import geopandas as gpd
+import numpy as np
+import pytest
+from shapely.geometry import Point
+from fire_visualizer import FireVisualizer
+
+def _write_shapefile(path, lat, lon):
+    n = len(lat)
+    gpd.GeoDataFrame({
+        'LATITUDE': lat,
+        'LONGITUDE': lon,
+        'BRIGHTNESS': np.linspace(300.0, 330.0, n),
+        'SCAN': np.ones(n),
+        'TRACK': np.ones(n),
+        'ACQ_DATE': ['2021-07-01', '2021-07-02', '2021-07-03'][:n],
+        'CONFIDENCE': [80] * n,
+        'SATELLITE': ['T'] * n
+    }, geometry=[Point(x, y) for x, y in zip(lon, lat)], crs="EPSG:4326").to_file(path)
+
+def test_load_data_reads_shapefile_within_bounds(tmp_path, monkeypatch):
+    """Detections inside the map bounds load; the one outside is filtered out"""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "NASA").mkdir()
+    _write_shapefile(tmp_path / "NASA" / "fire_archive_M6.shp", [45.0, 10.0, 50.0], [-110.0, -110.0, -100.0])
+
+    visualizer = FireVisualizer()
+    visualizer.load_data(data_dir=tmp_path / "NASA", force_reload=True)
+    assert visualizer.data['LATITUDE'].tolist() == [45.0, 50.0]
+    assert visualizer.data['datetime'].dt.day.tolist() == [1, 3]
+    assert visualizer.checkpoint_file.exists()
+
+def test_load_data_with_no_rows_in_bounds(tmp_path, monkeypatch):
+    """An empty selection is reported as such, and no checkpoint is written"""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "NASA").mkdir()
+    _write_shapefile(tmp_path / "NASA" / "fire_nrt_M6.shp", [10.0, -5.0], [20.0, 30.0])
+
+    visualizer = FireVisualizer()
+    with pytest.raises(ValueError, match="No fire records within the map bounds"):
+        visualizer.load_data(data_dir=tmp_path / "NASA", force_reload=True)
+    assert not visualizer.checkpoint_file.exists()
@@ -67,10 +67,10 @@ def run_interactive_test():
     # Test fire data retrieval
     print("\n3. Testing fire data retrieval...")
     fires = api.get_fires(2023, limit=5)
-    if fires:
+    if fires is not None and not fires.empty:
         print(f"✓ Successfully retrieved {len(fires)} fire records")
         print("\nSample record:")
-        pprint(fires[0])
+        pprint(fires.iloc[0].to_dict())
 
 if __name__ == '__main__':
     # Run interactive tests first
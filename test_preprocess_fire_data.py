@@ -0,0 +1,124 @@
+"""
+Tests for the NASA CSV preprocessing helpers
+"""
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from preprocess_fire_data import FireDataPreprocessor, _read_fire_csv, _validate_table
+
+MODIS_CSV = """latitude,longitude,brightness,scan,track,acq_date,acq_time,satellite,instrument,confidence,version,bright_t31,frp,daynight
+45.1,-110.2,310.5,1.0,1.0,2020-07-01,1230,Terra,MODIS,80,6.1,290.1,12.5,D
+45.2,-110.3,320.5,1.1,1.0,2020-07-02,0130,Aqua,MODIS,55,6.1,288.4,20.0,N
+95.0,-110.3,320.5,1.1,1.0,2020-07-02,0130,Aqua,MODIS,55,6.1,288.4,20.0,N
+"""
+
+VIIRS_CSV = """latitude,longitude,bright_ti4,scan,track,acq_date,acq_time,satellite,instrument,confidence,version,bright_ti5,frp,daynight
+40.1,-120.2,330.2,0.4,0.4,2021-08-01,1015,N,VIIRS,n,2.0NRT,295.0,5.5,D
+40.2,-120.3,335.7,0.4,0.4,2021-08-01,1016,N,VIIRS,h,2.0NRT,296.0,6.5,D
+"""
+
+def test_viirs_rows_survive_alongside_modis(tmp_path):
+    """A file without brightness columns keeps its rows when combined with MODIS data"""
+    modis = tmp_path / "modis.csv"
+    viirs = tmp_path / "viirs.csv"
+    modis.write_text(MODIS_CSV)
+    viirs.write_text(VIIRS_CSV)
+
+    modis_table, error = _read_fire_csv(modis, cache_dir=tmp_path / "cache")
+    assert error is None
+    viirs_table, error = _read_fire_csv(viirs, cache_dir=tmp_path / "cache")
+    assert error is None
+
+    # The out-of-range latitude is dropped, and the 99th-percentile trims
+    # (taken within each file) drop each file's hottest detection; VIIRS
+    # is only trimmed on fire_radiative_power
+    assert modis_table.num_rows == 1
+    assert viirs_table.num_rows == 1
+    assert 'brightness' not in viirs_table.column_names
+
+    combined = pa.concat_tables([modis_table, viirs_table], promote_options='default')
+    assert combined.num_rows == 2
+    assert combined['confidence'].to_pylist() == ['80', 'n']
+    assert combined['brightness'].null_count == 1
+
+    # A second read comes from the ingest cache and validates the same way
+    cached_table, error = _read_fire_csv(viirs, cache_dir=tmp_path / "cache")
+    assert error is None
+    assert cached_table.equals(viirs_table)
+
+def test_percentile_trims_are_sequential():
+    """Each 99th-percentile threshold uses the rows kept by the previous trims"""
+    n = 201
+    brightness = np.arange(n, dtype=np.float32)
+    frp = np.arange(n, dtype=np.float32)[::-1].copy()
+    table = pa.table({
+        'latitude': pa.array(np.full(n, 45.0), pa.float32()),
+        'longitude': pa.array(np.full(n, -100.0), pa.float32()),
+        'brightness': brightness,
+        'fire_radiative_power': frp
+    })
+
+    expected = np.ones(n, dtype=bool)
+    for values in (brightness, frp):
+        expected &= values <= np.percentile(values[expected], 99)
+
+    result = _validate_table(table)
+    assert result.num_rows == np.count_nonzero(expected)
+    assert result['brightness'].to_pylist() == brightness[expected].tolist()
+
+def test_ingest_cache_key_tracks_schema(tmp_path, monkeypatch):
+    """Changing the ingest schema or pipeline version changes the cache file"""
+    import preprocess_fire_data
+
+    csv = tmp_path / "modis.csv"
+    csv.write_text(MODIS_CSV)
+    key = preprocess_fire_data._ingest_cache_path(csv, tmp_path)
+    assert preprocess_fire_data._ingest_cache_path(csv, tmp_path) == key
+
+    monkeypatch.setattr(preprocess_fire_data, 'INGEST_SIGNATURE', 'other')
+    assert preprocess_fire_data._ingest_cache_path(csv, tmp_path) != key
+
+def test_point_geometry_is_geoarrow():
+    """The geometry column holds double (lon, lat) points that GeoArrow readers accept"""
+    import geopandas as gpd
+
+    table = pa.table({
+        'longitude': pa.array([-110.2, -120.3], pa.float32()),
+        'latitude': pa.array([45.1, 40.2], pa.float32())
+    })
+    result = FireDataPreprocessor._with_point_geometry(table)
+    assert result.schema.field('geometry').type.value_type == pa.float64()
+
+    points = gpd.GeoDataFrame.from_arrow(result)
+    assert points.crs == "EPSG:4326"
+    assert points.geometry.x.tolist() == table['longitude'].to_numpy().astype(float).tolist()
+    assert points.geometry.y.tolist() == table['latitude'].to_numpy().astype(float).tolist()
+
+def test_grouped_stats_match_pandas_groupby():
+    """Grouped reductions equal pandas groupby, with NaNs and empty groups"""
+    rng = np.random.default_rng(0)
+    n_groups = 7
+    codes = rng.integers(0, n_groups - 1, 500)  # the last group stays empty
+    codes[:5] = -1
+    values = rng.normal(300, 20, 500).astype(np.float32)
+    values[rng.choice(500, 40, replace=False)] = np.nan
+    values[codes == 2] = np.nan  # a group with only missing values
+
+    stats = FireDataPreprocessor._grouped_stats(codes, n_groups, values)
+    grouped = pd.Series(values)[codes >= 0].groupby(codes[codes >= 0])
+    expected = grouped.agg(['mean', 'min', 'max', 'count', 'sum']).reindex(range(n_groups))
+    expected[['count', 'sum']] = expected[['count', 'sum']].fillna(0)
+
+    for func in ['mean', 'min', 'max', 'count', 'sum']:
+        np.testing.assert_allclose(stats[func], expected[func], rtol=1e-6, err_msg=func)
+    assert stats['mean'].dtype == np.float32
+    assert stats['count'][2] == 0 and np.isnan(stats['min'][2])
+
+def test_period_labels_match_formatted_strings():
+    """Categorical labels equal formatting every key, categories sorted"""
+    keys = np.array([202012, 202101, 202012, 201903, 202101, 202011])
+    fmt = lambda k: f"{k // 100}-{k % 100:02d}"
+    labels = FireDataPreprocessor._period_labels(keys, fmt)
+    assert labels.astype(str).tolist() == [fmt(int(k)) for k in keys]
+    assert list(labels.categories) == sorted(set(fmt(int(k)) for k in keys))
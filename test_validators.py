@@ -0,0 +1,108 @@
+"""
+Tests for the validation helpers against the NumPy/pandas calls they replace
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from wildfires.config import BOUNDS
+from wildfires.validators import (
+    ValidationPipeline, _quartiles, compute_derived_fields,
+    validate_coordinates, validate_dates, validate_numeric_columns
+)
+
+@pytest.mark.parametrize('n', [1, 2, 3, 4, 5, 10, 101, 1000])
+def test_quartiles_match_percentile(n):
+    """Partition-based quartiles equal np.percentile's linear interpolation"""
+    rng = np.random.default_rng(n)
+    for values in (rng.normal(size=n), rng.integers(0, 5, size=n).astype(float)):
+        expected = np.percentile(values, [25, 75])
+        np.testing.assert_allclose(_quartiles(values.copy()), expected)
+
+def test_confidence_levels_match_qcut():
+    """Tercile buckets from searchsorted equal pd.qcut's, NaN included"""
+    rng = np.random.default_rng(0)
+    # MODIS-style integer confidences, so many values sit exactly on an edge
+    confidence = rng.integers(0, 101, 1000).astype(float)
+    confidence[rng.choice(1000, 50, replace=False)] = np.nan
+    assert np.isin(np.nanquantile(confidence, [1 / 3, 2 / 3]), confidence).all()
+    df = pd.DataFrame({'CONFIDENCE': confidence})
+
+    result = compute_derived_fields(df.copy())['confidence_level']
+    expected = pd.qcut(df['CONFIDENCE'], q=3, labels=['low', 'medium', 'high'])
+    assert result.astype(str).tolist() == expected.astype(str).tolist()
+    assert result.isna().sum() == 50
+    assert list(result.cat.categories) == ['low', 'medium', 'high']
+
+def _detections(n=400, seed=0):
+    """Raw FIRMS-like rows with every kind of invalid value mixed in"""
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        'LATITUDE': rng.uniform(20, 75, n),
+        'LONGITUDE': rng.uniform(-175, -45, n),
+        'BRIGHTNESS': rng.normal(320, 15, n).astype(object),
+        'SCAN': rng.uniform(-0.2, 2, n),
+        'TRACK': rng.uniform(0.5, 1.5, n),
+        'ACQ_DATE': pd.Series(pd.date_range('2020-01-01', periods=n, freq='D')).dt.strftime('%Y-%m-%d')
+    }, index=np.arange(n) * 2)
+    df.loc[df.index[:10], 'LATITUDE'] = np.nan
+    df.loc[df.index[10:20], 'BRIGHTNESS'] = 'n/a'
+    df.loc[df.index[20:25], 'BRIGHTNESS'] = 900.0
+    df.loc[df.index[25:30], 'ACQ_DATE'] = 'unknown'
+    df.loc[df.index[30:33], 'ACQ_DATE'] = '2999-01-01'
+    return df
+
+def _reference(df):
+    """The validation steps spelled out with plain pandas filters"""
+    df = df[
+        df['LATITUDE'].between(BOUNDS['south'], BOUNDS['north']) &
+        df['LONGITUDE'].between(BOUNDS['west'], BOUNDS['east'])
+    ].copy()
+    keep = pd.Series(True, index=df.index)
+    for col in ['BRIGHTNESS', 'SCAN', 'TRACK']:
+        df[col] = pd.to_numeric(df[col], errors='coerce').astype(np.float32)
+        keep &= df[col].notna() & (df[col] > 0)
+        q1, q3 = np.percentile(df.loc[keep, col], [25, 75])
+        keep &= df[col].between(q1 - 1.5 * (q3 - q1), q3 + 1.5 * (q3 - q1))
+    df = df[keep].copy()
+    df['datetime'] = pd.to_datetime(df['ACQ_DATE'], format='%Y-%m-%d', errors='coerce')
+    return df[df['datetime'] <= pd.Timestamp.now()]
+
+def test_pipeline_matches_reference_filters():
+    """The chained pipeline keeps the same rows and values as plain pandas"""
+    df = _detections()
+    original = df.copy()
+    result, stats = (ValidationPipeline(df)
+                     .coordinates()
+                     .numeric_columns(['BRIGHTNESS', 'SCAN', 'TRACK'])
+                     .dates()
+                     .result())
+    expected = _reference(df)
+
+    pd.testing.assert_index_equal(result.index, expected.index)
+    for col in ['LATITUDE', 'BRIGHTNESS', 'SCAN', 'TRACK']:
+        np.testing.assert_array_equal(result[col].to_numpy(dtype=float), expected[col].to_numpy(dtype=float))
+    assert (result['datetime'] == expected['datetime']).all()
+    pd.testing.assert_frame_equal(df, original)
+
+    assert stats['coordinates']['missing_coordinates'] == 10
+    assert len(result) == stats['dates']['original_rows'] - \
+        stats['dates']['invalid_dates'] - stats['dates']['future_dates']
+
+def test_validators_are_pipeline_steps():
+    """Chaining the standalone validators gives the pipeline's rows and stats"""
+    df = _detections(seed=1)
+    step, coordinate_stats = validate_coordinates(df)
+    step, numeric_stats = validate_numeric_columns(step, ['BRIGHTNESS', 'SCAN', 'TRACK'])
+    step, date_stats = validate_dates(step)
+
+    result, stats = (ValidationPipeline(df)
+                     .coordinates()
+                     .numeric_columns(['BRIGHTNESS', 'SCAN', 'TRACK'])
+                     .dates()
+                     .result())
+    pd.testing.assert_frame_equal(step, result)
+    assert stats == {'coordinates': coordinate_stats, 'numeric': numeric_stats, 'dates': date_stats}
+    assert numeric_stats['BRIGHTNESS']['missing_values'] > 0
+    assert numeric_stats['SCAN']['negative_values'] > 0
+    assert date_stats['invalid_dates'] > 0 and date_stats['future_dates'] > 0
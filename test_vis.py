@@ -0,0 +1,144 @@
+"""
+Tests for the NIFC download helpers in vis.py
+"""
+
+import json
+import logging
+from datetime import datetime, timedelta, timezone
+import numpy as np
+import pyarrow as pa
+from vis import _attributes_table, _combine_tables, _month_from_epoch_ms
+
+logger = logging.getLogger(__name__)
+
+def test_batches_with_different_inferred_types_combine():
+    """A field null or int-typed in an early batch keeps later batches' values"""
+    batches = [
+        [{'FIRE_YEAR': 1920, 'FIRE_SIZE': 10.0, 'CAUSE': None, 'ACRES': 5}],
+        [{'FIRE_YEAR': 1990, 'FIRE_SIZE': 2.5, 'CAUSE': 'Lightning', 'ACRES': 7.5}],
+        [{'FIRE_YEAR': 2020, 'FIRE_SIZE': 1.0, 'CAUSE': 'Human', 'ACRES': 'unknown', 'AGENCY': 'BLM'}]
+    ]
+    tables = [_attributes_table(batch, logger) for batch in batches]
+    assert tables[0].schema.field('CAUSE').type == pa.null()
+
+    combined = _combine_tables(tables)
+    assert combined.schema.field('FIRE_YEAR').type == pa.int16()
+    assert combined['CAUSE'].to_pylist() == [None, 'Lightning', 'Human']
+    assert combined['AGENCY'].to_pylist() == [None, None, 'BLM']
+
+    # int and float promote to float; adding a string makes the field text
+    assert _combine_tables(tables[:2]).schema.field('ACRES').type == pa.float64()
+    assert combined['ACRES'].to_pylist() == ['5', '7.5', 'unknown']
+
+def test_records_with_mixed_values_infer_as_strings():
+    """A batch whose values can't share a type falls back to strings"""
+    table = _attributes_table([{'UNIT': 4}, {'UNIT': 'CA-XYZ'}, {}], logger)
+    assert table['UNIT'].to_pylist() == ['4', 'CA-XYZ', None]
+
+def test_month_from_epoch_ms_matches_datetime():
+    """Integer month extraction agrees with datetime, including before 1970"""
+    rng = np.random.default_rng(0)
+    start = int(datetime(1900, 1, 1, tzinfo=timezone.utc).timestamp() * 1000)
+    end = int(datetime(2030, 12, 31, tzinfo=timezone.utc).timestamp() * 1000)
+    epoch_ms = np.concatenate([
+        rng.integers(start, end, size=5000),
+        # Month boundaries around the epoch and in the early record years
+        np.array([-1, 0, 1, -2678400000, -2678400001, start, start - 1]),
+        np.array([
+            int(datetime(year, month, 1, tzinfo=timezone.utc).timestamp() * 1000) + offset
+            for year in (1920, 1969, 1970, 2000)
+            for month in (1, 2, 3, 12)
+            for offset in (-1, 0)
+        ])
+    ]).astype(np.int64)
+
+    epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+    expected = [(epoch + timedelta(milliseconds=int(ms))).month for ms in epoch_ms]
+    assert _month_from_epoch_ms(epoch_ms).tolist() == expected
+
+def test_fetch_batch_posts_object_ids(tmp_path, monkeypatch):
+    """OBJECTID batches go in a POST body, not the URL"""
+    from vis import NIFCDataConnector
+
+    monkeypatch.chdir(tmp_path)
+    nifc = NIFCDataConnector()
+    sent = {}
+
+    class Response:
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return {'features': [{'attributes': {'OBJECTID': 1}}]}
+
+    def post(url, data, timeout):
+        sent.update(url=url, data=data)
+        return Response()
+
+    monkeypatch.setattr(nifc.session, 'post', post)
+    records = nifc._fetch_batch(2020, list(range(1, 1001)))
+
+    assert records == [{'OBJECTID': 1}]
+    assert sent['url'] == nifc.historic_fires_url
+    assert sent['data']['objectIds'] == ','.join(map(str, range(1, 1001)))
+
+def test_historic_fires_bounds_batches_in_flight(tmp_path, monkeypatch):
+    """Batches are submitted as earlier ones are consumed, not all up front"""
+    import threading
+    import time
+    from vis import NIFCDataConnector
+
+    monkeypatch.chdir(tmp_path)
+    nifc = NIFCDataConnector()
+    started = []
+    seen = {}
+    lock = threading.Lock()
+
+    monkeypatch.setattr(nifc, '_fetch_object_ids', lambda year: list(range(year * 100, year * 100 + 10)))
+
+    def fetch_batch(year, ids):
+        with lock:
+            started.append(ids[0])
+        if ids[0] == 2000 * 100:
+            # Hold the first batch so the consumer can't pop anything yet
+            time.sleep(0.2)
+            seen['started'] = len(started)
+        return [{'FIRE_YEAR': year, 'OBJECTID': i} for i in ids]
+
+    monkeypatch.setattr(nifc, '_fetch_batch', fetch_batch)
+    monkeypatch.setattr(nifc, '_save_final_data', lambda table: table)
+
+    table = nifc.get_historic_fires(start_year=2000, end_year=2009, chunk_size=2, max_workers=2)
+    assert len(started) == 50
+    assert seen['started'] <= 4
+    assert table['OBJECTID'].to_pylist() == [
+        year * 100 + i for year in range(2000, 2010) for i in range(10)
+    ]
+
+def test_historic_fires_refuses_incomplete_download(tmp_path, monkeypatch):
+    """A failed batch raises instead of saving a dataset with it missing"""
+    import pytest
+    import requests
+    from vis import NIFCDataConnector
+
+    monkeypatch.chdir(tmp_path)
+    nifc = NIFCDataConnector()
+    monkeypatch.setattr(nifc, '_fetch_object_ids', lambda year: [year * 10, year * 10 + 1])
+
+    def post(url, data, timeout):
+        if data['objectIds'].startswith('2001'):
+            raise requests.exceptions.ConnectionError("reset")
+        ids = map(int, data['objectIds'].split(','))
+        response = requests.models.Response()
+        response.status_code = 200
+        response._content = json.dumps({'features': [{'attributes': {'OBJECTID': i}} for i in ids]}).encode()
+        return response
+
+    monkeypatch.setattr(nifc.session, 'post', post)
+    saved = []
+    monkeypatch.setattr(nifc, '_save_final_data', saved.append)
+
+    with pytest.raises(RuntimeError, match="1 batch"):
+        nifc.get_historic_fires(start_year=2000, end_year=2002)
+    assert saved == []
+    assert nifc._fetch_batch(2001, [20010]) is None
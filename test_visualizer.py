@@ -0,0 +1,104 @@
+"""
+Tests for FireVisualizer aggregation and frame building
+"""
+
+import base64
+import json
+import numpy as np
+import pandas as pd
+import pytest
+from wildfires import visualizer as visualizer_module
+from wildfires.data_manager import DataManager
+from wildfires.config import VIS_SETTINGS
+from wildfires.visualizer import FireVisualizer
+
+@pytest.fixture
+def visualizer(tmp_path, monkeypatch):
+    """FireVisualizer over a temporary directory, without any downloads"""
+    monkeypatch.setattr(DataManager, '_load_states_data', lambda self: None)
+    monkeypatch.setattr(visualizer_module, '_load_states_geojson', lambda cache_file: None)
+    manager = DataManager(data_dir=tmp_path / "NASA", output_dir=tmp_path / "processed")
+    return FireVisualizer(manager)
+
+def _fires(n, seed=0):
+    """Processed-style fire records spread over a few years and states"""
+    rng = np.random.default_rng(seed)
+    datetimes = pd.to_datetime('2018-01-01') + pd.to_timedelta(rng.integers(0, 4 * 365, n), unit='D')
+    return pd.DataFrame({
+        'datetime': datetimes,
+        'LATITUDE': rng.uniform(30, 50, n),
+        'LONGITUDE': rng.uniform(-120, -80, n),
+        'BRIGHTNESS': rng.uniform(300, 400, n),
+        'fire_area': rng.uniform(0.1, 5, n),
+        'intensity': rng.uniform(0.5, 2, n),
+        'state': pd.Categorical(
+            rng.choice(['California', 'Oregon'], n),
+            categories=['California', 'Nevada', 'Oregon', 'Unknown']
+        )
+    })
+
+def test_state_aggregation_skips_unobserved_states(visualizer):
+    """Categories with no fires don't produce empty state rows"""
+    data = _fires(200)
+    data['season'] = 'Summer'
+    data['year'] = data['datetime'].dt.year
+    data['period_start'] = data['datetime'].dt.to_period('Q').dt.start_time
+
+    _, state_data = visualizer._aggregate_by_location_and_season(data)
+    expected = data.groupby(data['state'].astype(str))['fire_area'].sum()
+    assert sorted(state_data['state'].astype(str)) == ['California', 'Oregon']
+    assert state_data['fire_count'].sum() == len(data)
+    np.testing.assert_allclose(
+        state_data.set_index(state_data['state'].astype(str))['fire_area'].sort_index(),
+        expected.sort_index()
+    )
+
+def test_gpu_visualization_packs_every_point(visualizer, tmp_path):
+    """The deck.gl page is written with one packed entry per capped point"""
+    visualizer.data_manager.processed_data = _fires(500)
+    output = tmp_path / "gpu.html"
+    visualizer.create_visualization_gpu(str(output))
+
+    page = output.read_text(encoding='utf-8')
+    assert f'<script src="{VIS_SETTINGS["deck_gl"]["script_url"]}"></script>' in page
+    payload = json.loads(page.split('var payload = ', 1)[1].split(';\n', 1)[0])
+    n = payload['length']
+    assert n > 0
+    assert payload['states'].startswith('http')
+
+    def unpack(key, dtype):
+        return np.frombuffer(base64.b64decode(payload[key]), dtype=dtype)
+
+    assert len(unpack('positions', '<f4')) == 2 * n
+    assert len(unpack('colors', np.uint8)) == 3 * n
+    for key, dtype in [('radii', '<f4'), ('frames', '<f4'), ('areas', '<f4'), ('counts', '<i4')]:
+        assert len(unpack(key, dtype)) == n
+    frames = unpack('frames', '<f4')
+    assert frames.min() == 0 and frames.max() == len(payload['labels']) - 1
+
+def test_cap_frames_limits_each_frame(visualizer, monkeypatch):
+    """Frames over the cap are sampled down to it, smaller ones kept whole"""
+    monkeypatch.setitem(visualizer_module.PERFORMANCE, 'max_points_per_frame', 50)
+    rng = np.random.default_rng(0)
+    sizes = {('Summer', 2020): 200, ('Fall', 2020): 30, ('Winter', 2021): 50}
+    seasonal_data = pd.concat([
+        pd.DataFrame({
+            'year': year,
+            'season': season,
+            'intensity': rng.uniform(-2, 2, n),
+            'fire_area': rng.uniform(0, 5, n)
+        })
+        for (season, year), n in sizes.items()
+    ], ignore_index=True)
+    seasonal_data.loc[0, 'fire_area'] = 0  # zero weight still gets a key
+
+    capped = visualizer._cap_frames(seasonal_data)
+    counts = capped.groupby(['season', 'year']).size().to_dict()
+    assert counts == {('Summer', 2020): 50, ('Fall', 2020): 30, ('Winter', 2021): 50}
+    assert capped.index.is_unique
+    
+    # Sampling favours heavier rows: intensity * area
+    weight = (seasonal_data['intensity'].abs() * seasonal_data['fire_area'])
+    summer = seasonal_data['season'] == 'Summer'
+    assert weight[capped.index[capped['season'] == 'Summer']].mean() > weight[summer].mean()
+    pd.testing.assert_frame_equal(capped, visualizer._cap_frames(seasonal_data))
@@ -28,8 +28,8 @@ def test_year(year: int = 2023):
     # Get sample of fires
     print("\n2. Sample Records:")
     fires = api.get_fires(year, limit=5)
-    if fires:
-        df = pd.DataFrame([f['attributes'] for f in fires])
+    if fires is not None and not fires.empty:
+        df = fires
         
         # Convert dates
         for date_col in ['DISCOVERY_DATE', 'CONT_DATE']:
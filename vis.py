@@ -1,12 +1,112 @@
 import requests
-import pandas as pd
-import folium
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 from datetime import datetime, timedelta
-import time
-import os
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from itertools import islice
 import logging
 
+# Arrow types of the fields used downstream. Other fields returned by the
+# service keep their inferred types.
+FIRE_SCHEMA = pa.schema([
+    ('FIRE_YEAR', pa.int16()),
+    ('DISCOVERY_DATE', pa.int64()),
+    ('CONT_DATE', pa.int64()),
+    ('FIRE_SIZE', pa.float32()),
+    ('STATE', pa.dictionary(pa.int16(), pa.string())),
+    ('LATITUDE', pa.float32()),
+    ('LONGITUDE', pa.float32())
+])
+
+# Season names and each month's season code (index 0 = January)
+SEASON_NAMES = ['Winter', 'Spring', 'Summer', 'Fall']
+MONTH_SEASON_CODES = np.array([0, 0, 1, 1, 1, 2, 2, 2, 3, 3, 3, 0], dtype=np.int8)
+
+MS_PER_DAY = 24 * 60 * 60 * 1000
+
+def _month_from_epoch_ms(epoch_ms):
+    """Calendar month (1-12) of int64 epoch-millisecond values
+    
+    Integer civil-from-days conversion (H. Hinnant's algorithm), so no
+    datetime64 array is needed.
+    """
+    z = epoch_ms // MS_PER_DAY + 719468
+    era = z // 146097
+    doe = z - era * 146097
+    yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+    doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+    mp = (5 * doy + 2) // 153
+    return np.where(mp < 10, mp + 3, mp - 9)
+
+def _infer_array(values):
+    """Arrow array with an inferred type; mixed values fall back to strings"""
+    try:
+        return pa.array(values)
+    except (pa.ArrowException, TypeError, ValueError):
+        return pa.array([None if v is None else str(v) for v in values], type=pa.string())
+
+def _attributes_table(records, logger):
+    """Build an Arrow table from attribute dicts, column by column
+    
+    Fields in FIRE_SCHEMA are converted straight to their declared type with
+    no inference; a declared field whose values don't fit keeps an inferred
+    type instead. Every other field is inferred from this batch alone, so
+    batches are reconciled by _combine_tables.
+    """
+    names = dict.fromkeys(name for record in records for name in record)
+    columns = {}
+    for name in names:
+        values = [record.get(name) for record in records]
+        if name in FIRE_SCHEMA.names:
+            field_type = FIRE_SCHEMA.field(name).type
+            try:
+                columns[name] = pa.array(values, type=field_type)
+                continue
+            except (pa.ArrowException, TypeError, ValueError) as e:
+                logger.warning(f"Error processing {name}, keeping inferred type: {e}")
+        columns[name] = _infer_array(values)
+    return pa.table(columns)
+
+def _combine_tables(tables):
+    """Concatenate batch tables whose inferred field types may differ
+    
+    Each field gets the permissive promotion of its per-batch types (null
+    takes any type, ints widen to floats); fields whose types can't be
+    promoted become strings. Fields missing from a batch are null there.
+    """
+    candidates = {}
+    for table in tables:
+        for field in table.schema:
+            candidates.setdefault(field.name, []).append(field.type)
+    
+    fields = []
+    for name, types in candidates.items():
+        try:
+            unified = pa.unify_schemas(
+                [pa.schema([(name, field_type)]) for field_type in types],
+                promote_options='permissive'
+            ).field(name).type
+        except (pa.ArrowException, TypeError):
+            unified = pa.string()
+        fields.append(pa.field(name, unified))
+    schema = pa.schema(fields)
+    
+    return pa.concat_tables([
+        pa.Table.from_arrays([
+            table[field.name].cast(field.type) if field.name in table.column_names
+            else pa.nulls(table.num_rows, field.type)
+            for field in schema
+        ], schema=schema)
+        for table in tables
+    ])
+
 class NIFCDataConnector:
     def __init__(self):
         # Base URLs for NIFC's ArcGIS REST services
@@ -21,115 +121,223 @@ class NIFCDataConnector:
         self.data_dir = Path('data')
         self.data_dir.mkdir(exist_ok=True)
         
-    def _make_request(self, url, params, max_retries=3, delay=1):
+        # One pooled session so every chunk reuses the same keep-alive TLS
+        # connection; retries with exponential backoff happen in the adapter.
+        # Responses are cached on disk (POSTs keyed by their form body):
+        # historic years don't change, so they are kept for 30 days, while
+        # current perimeters expire after an hour.
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=['GET', 'POST']  # POST queries are read-only too
+        )
+        self.session = requests_cache.CachedSession(
+            str(self.data_dir / 'nifc_cache'),
+            backend='sqlite',
+            expire_after=timedelta(days=30),
+            urls_expire_after={self.current_fires_url: 3600},
+            allowable_methods=['GET', 'POST'],
+            cache_control=True
+        )
+        self.session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+        )
+        
+    def _make_request(self, url, params, method='GET'):
         """
-        Make a rate-limited request with retries
+        Make a request over the pooled session (retries are handled by it)
+        
+        With ``method='POST'`` the parameters are sent as a form body, for
+        queries too long for a URL.
         """
-        for attempt in range(max_retries):
-            try:
-                response = requests.get(url, params=params)
-                response.raise_for_status()
-                time.sleep(delay)  # Rate limiting
-                return response.json()
-            except requests.exceptions.RequestException as e:
-                self.logger.error(f"Attempt {attempt + 1}/{max_retries} failed: {e}")
-                if attempt == max_retries - 1:
-                    raise
-                time.sleep(delay * (attempt + 1))  # Exponential backoff
-        return None
-
-    def get_historic_fires(self, start_year=1920, end_year=None, chunk_size=1000):
+        try:
+            if method == 'POST':
+                response = self.session.post(url, data=params, timeout=(5, 30))
+            else:
+                response = self.session.get(url, params=params, timeout=(5, 30))
+            response.raise_for_status()
+            return response.json()
+        except requests.exceptions.RequestException as e:
+            self.logger.error(f"Request failed: {e}")
+            raise
+
+    def get_historic_fires(self, start_year=1920, end_year=None, chunk_size=1000, max_workers=8):
         """
         Fetch historical wildfire data year by year
+        
+        Each year's OBJECTIDs are requested first (returnIdsOnly) and split
+        into batches of ``chunk_size``; batches are then fetched concurrently
+        by ID over the pooled session, which avoids the server-side cost of
+        deep resultOffset paging, and collected back in order.
+        
+        Raises:
+            RuntimeError: if any year's ID listing or any batch failed, so an
+                incomplete download is never saved as the final dataset
         """
         if end_year is None:
             end_year = datetime.now().year
+        years = range(start_year, end_year + 1)
 
-        all_data = []
+        # Records are streamed to Parquet one batch file at a time, so only
+        # the current batch is held in memory. Each batch keeps its own
+        # inferred schema; they are reconciled when read back.
+        checkpoint_dir = self.data_dir / 'US_fires'
+        checkpoint_dir.mkdir(exist_ok=True)
+        for stale in checkpoint_dir.glob('part-*.parquet'):
+            stale.unlink()
+        parts = []
+        batch_data = []
+        
+        def flush(year):
+            part = checkpoint_dir / f"part-{len(parts):05d}.parquet"
+            pq.write_table(_attributes_table(batch_data, self.logger), part, compression='snappy')
+            parts.append(part)
+            batch_data.clear()
+            self.logger.info(f"Saved intermediate data through {year} to {part}")
         
-        for year in range(start_year, end_year + 1):
-            self.logger.info(f"Fetching data for year {year}")
+        with ThreadPoolExecutor(max_workers=max_workers) as ex:
+            year_ids = list(ex.map(self._fetch_object_ids, years))
+            failed_years = [year for year, ids in zip(years, year_ids) if ids is None]
+            failed_batches = 0
+            pending = (
+                (year, ids[i:i + chunk_size])
+                for year, ids in zip(years, year_ids) if ids is not None
+                for i in range(0, len(ids), chunk_size)
+            )
             
-            params = {
-                'where': f"FIRE_YEAR = {year}",
-                'outFields': '*',  # Get all fields to handle different data structures
-                'returnGeometry': 'false',
-                'f': 'json',
-                'resultOffset': 0,
-                'resultRecordCount': chunk_size
-            }
+            # At most 2 * max_workers batches are in flight or waiting to be
+            # consumed; one more is submitted each time the oldest is popped,
+            # so finished batches don't pile up ahead of the writer
+            batches = deque()
             
-            while True:
-                try:
-                    response_data = self._make_request(self.historic_fires_url, params)
-                    
-                    if not response_data or 'features' not in response_data:
-                        break
-                    
-                    features = response_data['features']
-                    if not features:
-                        break
-                    
-                    # Extract attributes from features
-                    year_data = [feature['attributes'] for feature in features]
-                    all_data.extend(year_data)
-                    
-                    # Update offset for next chunk
-                    params['resultOffset'] += chunk_size
-                    
-                    self.logger.info(f"Fetched {len(features)} records for {year}")
-                    
-                    # Save intermediate results every 10,000 records
-                    if len(all_data) % 10000 == 0:
-                        self._save_intermediate_data(all_data, year)
-                    
-                except Exception as e:
-                    self.logger.error(f"Error processing year {year}: {e}")
-                    break
-
-        if not all_data:
+            def submit(count):
+                for year, ids in islice(pending, count):
+                    batches.append((year, ex.submit(self._fetch_batch, year, ids)))
+            
+            submit(2 * max_workers)
+            while batches:
+                year, future = batches.popleft()
+                year_data = future.result()
+                submit(1)
+                if year_data is None:
+                    failed_batches += 1
+                    continue
+                if not year_data:
+                    continue
+                batch_data.extend(year_data)
+                
+                # Write a batch file every 10,000 records
+                if len(batch_data) >= 10000:
+                    flush(year)
+        
+        if batch_data:
+            flush(end_year)
+        
+        if failed_years or failed_batches:
+            raise RuntimeError(
+                f"Download incomplete, final dataset not saved: IDs could not be listed "
+                f"for years {failed_years} and {failed_batches} batch(es) failed "
+                f"(fetched batches are in {checkpoint_dir})"
+            )
+
+        if not parts:
             self.logger.warning("No data was collected")
             return None
             
-        return self._save_final_data(all_data)
+        return self._save_final_data(_combine_tables([pq.read_table(part) for part in parts]))
 
-    def _save_intermediate_data(self, data, current_year):
-        """Save intermediate results to prevent data loss"""
-        df = pd.DataFrame(data)
-        intermediate_file = self.data_dir / f'US_fires_temp_{current_year}.csv'
-        df.to_csv(intermediate_file, index=False)
-        self.logger.info(f"Saved intermediate data to {intermediate_file}")
+    def _fetch_object_ids(self, year):
+        """Sorted OBJECTIDs of the records the service holds for ``year`` (None on failure)"""
+        params = {
+            'where': f"FIRE_YEAR = {year}",
+            'returnIdsOnly': 'true',
+            'f': 'json'
+        }
+        try:
+            response_data = self._make_request(self.historic_fires_url, params)
+            ids = sorted((response_data or {}).get('objectIds') or [])
+            self.logger.info(f"Fetching {len(ids)} records for year {year}")
+            return ids
+        except Exception as e:
+            self.logger.error(f"Error listing records for year {year}: {e}")
+            return None
 
-    def _save_final_data(self, data):
-        """Process and save the final dataset"""
+    def _fetch_batch(self, year, object_ids):
+        """Fetch the attribute dicts for one batch of OBJECTIDs
+        
+        Sent as a POST: a thousand comma-joined IDs make a URL of several
+        KB, past the URL length limits of common ArcGIS front ends (414).
+        Returns None if the request fails, so the caller can tell a lost
+        batch from an empty one.
+        """
+        params = {
+            'objectIds': ','.join(map(str, object_ids)),
+            'outFields': '*',  # Get all fields to handle different data structures
+            'returnGeometry': 'false',
+            'f': 'json'
+        }
         try:
-            df = pd.DataFrame(data)
+            response_data = self._make_request(self.historic_fires_url, params, method='POST')
+            if not response_data or 'features' not in response_data:
+                # ArcGIS reports query errors in a 200 response body
+                self.logger.error(
+                    f"No features for year {year} (OBJECTIDs {object_ids[0]}-{object_ids[-1]}): "
+                    f"{(response_data or {}).get('error')}"
+                )
+                return None
+            
+            # Extract attributes from features
+            features = response_data['features']
+            self.logger.info(f"Fetched {len(features)} records for {year}")
+            return [feature['attributes'] for feature in features]
             
-            # Clean and process the data with error handling
+        except Exception as e:
+            self.logger.error(
+                f"Error processing year {year} (OBJECTIDs {object_ids[0]}-{object_ids[-1]}): {e}"
+            )
+            return None
+
+    def _save_final_data(self, table):
+        """Process and save the final dataset from the collected Arrow table"""
+        # pandas is only needed here, so importing this module stays cheap
+        import pandas as pd
+        
+        try:
+            # Derived fields are computed straight from the int64 epoch-ms
+            # values; dates become timestamps only for the output columns
+            epoch_ms = {}
             for date_col in ['DISCOVERY_DATE', 'CONT_DATE']:
-                try:
-                    if date_col in df.columns:
-                        df[date_col] = pd.to_datetime(df[date_col], unit='ms', errors='coerce')
-                except Exception as e:
-                    self.logger.warning(f"Error processing {date_col}: {e}")
-                    df[date_col] = pd.NaT
+                if date_col in table.column_names:
+                    column = table[date_col]
+                    epoch_ms[date_col] = (
+                        pc.fill_null(column, 0).to_numpy(),
+                        column.is_valid().to_numpy()
+                    )
+                    i = table.column_names.index(date_col)
+                    table = table.set_column(i, date_col, column.cast(pa.timestamp('ms')))
+            
+            df = table.to_pandas()
             
             # Calculate duration in days where both dates are available
-            if 'DISCOVERY_DATE' in df.columns and 'CONT_DATE' in df.columns:
-                df['DURATION'] = (df['CONT_DATE'] - df['DISCOVERY_DATE']).dt.total_seconds() / (24 * 60 * 60)
+            if 'DISCOVERY_DATE' in epoch_ms and 'CONT_DATE' in epoch_ms:
+                (disc_ms, disc_ok), (cont_ms, cont_ok) = epoch_ms['DISCOVERY_DATE'], epoch_ms['CONT_DATE']
+                df['DURATION'] = np.where(
+                    disc_ok & cont_ok, (cont_ms - disc_ms) / MS_PER_DAY, np.nan
+                )
             
-            # Add season column if discovery date is available
-            if 'DISCOVERY_DATE' in df.columns:
-                df['SEASON'] = df['DISCOVERY_DATE'].dt.month.map({
-                    12: 'Winter', 1: 'Winter', 2: 'Winter',
-                    3: 'Spring', 4: 'Spring', 5: 'Spring',
-                    6: 'Summer', 7: 'Summer', 8: 'Summer',
-                    9: 'Fall', 10: 'Fall', 11: 'Fall'
-                })
+            # Add season column if discovery date is available: month-indexed
+            # lookup into a Categorical; missing dates get code -1 (NaN)
+            if 'DISCOVERY_DATE' in epoch_ms:
+                disc_ms, disc_ok = epoch_ms['DISCOVERY_DATE']
+                months = _month_from_epoch_ms(disc_ms)
+                codes = np.where(disc_ok, MONTH_SEASON_CODES[months - 1], -1).astype(np.int8)
+                df['SEASON'] = pd.Categorical.from_codes(codes, SEASON_NAMES)
             
-            # Save to CSV
-            output_file = self.data_dir / 'US.csv'
-            df.to_csv(output_file, index=False)
+            # Save to Parquet
+            output_file = self.data_dir / 'US.parquet'
+            df.to_parquet(output_file, index=False, compression='snappy')
             self.logger.info(f"Saved final dataset to {output_file}")
             
             return df
@@ -148,7 +356,7 @@ def main():
         
         if df is not None:
             print(f"Successfully downloaded and processed {len(df)} fire records")
-            print(f"Data saved to {nifc.data_dir / 'US.csv'}")
+            print(f"Data saved to {nifc.data_dir / 'US.parquet'}")
             
             # Display basic statistics
             print("\nBasic Statistics:")
@@ -4,6 +4,7 @@ Configuration settings for the Wildfire Analysis System
 
 from pathlib import Path
 from typing import Dict, List
+import numpy as np
 
 # Data paths
 DATA_DIR = Path("data/NASA")
@@ -27,6 +28,16 @@ SEASONS = {
     'Fall': [9, 10, 11]
 }
 
+# Season lookups indexed by month number (index 0 unused), precomputed from
+# SEASONS: the season name, and its code (position in SEASONS) for building
+# Categoricals with pd.Categorical.from_codes(..., list(SEASONS))
+MONTH_TO_SEASON_LUT = np.array([''] * 13, dtype=object)
+MONTH_TO_SEASON_CODE = np.zeros(13, dtype=np.int8)
+for _code, (_season, _months) in enumerate(SEASONS.items()):
+    MONTH_TO_SEASON_LUT[_months] = _season
+    MONTH_TO_SEASON_CODE[_months] = _code
+del _code, _season, _months
+
 # Visualization settings
 VIS_SETTINGS = {
     'map': {
@@ -51,6 +62,10 @@ VIS_SETTINGS = {
         'duration': 'P3M',      # 3 months per frame
         'period': 'P3M',        # 3 months between frames
         'speeds': [0.25, 0.5, 1, 2, 4]  # Available playback speeds
+    },
+    'deck_gl': {
+        # Script loaded by the GPU (WebGL) visualization page
+        'script_url': 'https://unpkg.com/deck.gl@8.9.35/dist.min.js'
     }
 }
 
@@ -8,10 +8,65 @@ import geopandas as gpd
 from pathlib import Path
 import numpy as np
 from datetime import datetime
-import pickle
 import logging
 from typing import Dict, List, Optional, Tuple, Union
-from shapely.geometry import Point
+from .config import SEASONS, MONTH_TO_SEASON_CODE
+import shapely
+import pyogrio
+import requests
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+# US state boundaries (GeoJSON, feature ids are state codes)
+STATES_URL = 'https://raw.githubusercontent.com/python-visualization/folium/master/examples/data/us-states.json'
+
+# Shapefile fields used by the pipeline; everything else is skipped on read
+RAW_COLUMNS = [
+    'LATITUDE', 'LONGITUDE', 'BRIGHTNESS', 'SCAN', 'TRACK',
+    'ACQ_DATE', 'CONFIDENCE', 'SATELLITE'
+]
+
+# Measurement fields kept as float32 once read (coordinates and the derived
+# fire_area/intensity are float32 too after clean_data)
+MEASUREMENT_COLUMNS = ['BRIGHTNESS', 'SCAN', 'TRACK']
+
+def _read_shapefile(shp: Path, bbox: Tuple[float, float, float, float]) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
+    """
+    Read the used fields of one FIRMS shapefile within ``bbox``
+    
+    Module-level so it can run in a worker process; returns ``(df, error)``
+    so errors are logged by the parent.
+    
+    The bounds are applied as an attribute filter on the LATITUDE and
+    LONGITUDE fields (what clean_data checks too): a spatial ``bbox`` filter
+    returns no rows when geometries are skipped on the Arrow read path.
+    """
+    try:
+        info = pyogrio.read_info(shp)
+        dtypes = dict(zip(info['fields'], info['dtypes']))
+        where = None
+        if all(np.dtype(dtypes.get(col, object)).kind in 'if' for col in ('LATITUDE', 'LONGITUDE')):
+            west, south, east, north = bbox
+            where = (
+                f"LATITUDE >= {south} AND LATITUDE <= {north} AND "
+                f"LONGITUDE >= {west} AND LONGITUDE <= {east}"
+            )
+        df = pyogrio.read_dataframe(
+            shp,
+            columns=[col for col in RAW_COLUMNS if col in dtypes],
+            where=where,
+            read_geometry=False,
+            use_arrow=True
+        )
+        # Typed shapefile fields arrive numeric from Arrow; text-typed ones
+        # are left for clean_data to coerce
+        for col in MEASUREMENT_COLUMNS:
+            if col in df.columns and pd.api.types.is_float_dtype(df[col]):
+                df[col] = df[col].astype(np.float32)
+        return df, None
+    except Exception as e:
+        return None, f"Error reading {shp}: {e}"
 
 class DataManager:
     def __init__(self, data_dir: str = "data/NASA", output_dir: str = "data/processed"):
@@ -51,44 +106,87 @@ class DataManager:
             'east': -50   # Include eastern Canada
         }
         
+        # Cell size (degrees) of the rasterized state lookup grid
+        self.state_grid_resolution = 0.05
+        self._state_grid = None
+        
         # Define seasons
-        self.seasons = {
-            'Winter': [12, 1, 2],
-            'Spring': [3, 4, 5],
-            'Summer': [6, 7, 8],
-            'Fall': [9, 10, 11]
-        }
+        self.seasons = {season: list(months) for season, months in SEASONS.items()}
         
         # Load US states shapefile
         self._load_states_data()
     
     def _load_states_data(self):
-        """Load US states boundary data"""
+        """Load US states boundary data
+        
+        The GeoJSON is downloaded once and kept as a Feather file in the
+        cache directory; later instances read that instead of the network.
+        """
+        cached = self.cache_dir / "us_states.feather"
         try:
-            self.states_gdf = gpd.read_file(
-                'https://raw.githubusercontent.com/python-visualization/folium/master/examples/data/us-states.json'
-            )
-            self.states_gdf = self.states_gdf.to_crs("EPSG:4326")  # Ensure correct projection
+            if not cached.exists():
+                response = requests.get(STATES_URL, timeout=30)
+                response.raise_for_status()
+                features = response.json()['features']
+                states = gpd.GeoDataFrame.from_features(features, crs="EPSG:4326")
+                states['id'] = [feature.get('id') for feature in features]
+                states.to_crs("EPSG:4326").to_feather(cached)  # Ensure correct projection
+            self.states_gdf = gpd.read_feather(cached)
+            self._state_grid = self._rasterize_states()
         except Exception as e:
             logging.error(f"Error loading states data: {e}")
             self.states_gdf = None
+            self._state_grid = None
+    
+    def _rasterize_states(self) -> np.ndarray:
+        """
+        Rasterize state polygons over the North America bounds
+        
+        Returns:
+            int16 grid of row positions in states_gdf (-1 outside any state),
+            row 0 at the southern edge and column 0 at the western edge
+        """
+        res = self.state_grid_resolution
+        south, west = self.bounds['south'], self.bounds['west']
+        n_rows = int(np.ceil((self.bounds['north'] - south) / res))
+        n_cols = int(np.ceil((self.bounds['east'] - west) / res))
+        lat_centers = south + (np.arange(n_rows) + 0.5) * res
+        lon_centers = west + (np.arange(n_cols) + 0.5) * res
+        
+        grid = np.full((n_rows, n_cols), -1, dtype=np.int16)
+        for i, geom in enumerate(self.states_gdf.geometry):
+            if geom is None:
+                continue
+            # Only test the cell centers inside this state's bounding box
+            minx, miny, maxx, maxy = geom.bounds
+            r0, r1 = max(int((miny - south) / res), 0), min(int(np.ceil((maxy - south) / res)), n_rows)
+            c0, c1 = max(int((minx - west) / res), 0), min(int(np.ceil((maxx - west) / res)), n_cols)
+            if r0 >= r1 or c0 >= c1:
+                continue
+            lon, lat = np.meshgrid(lon_centers[c0:c1], lat_centers[r0:r1])
+            grid[r0:r1, c0:c1][shapely.contains_xy(geom, lon, lat)] = i
+        return grid
     
     def _assign_states(self, df: pd.DataFrame) -> pd.DataFrame:
         """Assign state information to each fire location"""
-        if self.states_gdf is None:
+        if self.states_gdf is None or self._state_grid is None:
             logging.warning("States data not available, skipping state assignment")
-            df['state'] = 'Unknown'
+            df['state'] = pd.Categorical(np.full(len(df), 'Unknown', dtype=object))
             return df
         
-        # Create GeoDataFrame from fire locations
-        geometry = [Point(xy) for xy in zip(df['LONGITUDE'], df['LATITUDE'])]
-        fires_gdf = gpd.GeoDataFrame(df, geometry=geometry, crs="EPSG:4326")
-        
-        # Spatial join with states
-        joined = gpd.sjoin(fires_gdf, self.states_gdf, predicate='within')
-        
-        # Add state information back to original DataFrame
-        df['state'] = joined['id'].fillna('Unknown')
+        # Look each fire up in the rasterized state grid
+        res = self.state_grid_resolution
+        n_rows, n_cols = self._state_grid.shape
+        rows = np.floor((df['LATITUDE'].to_numpy(dtype=float) - self.bounds['south']) / res)
+        cols = np.floor((df['LONGITUDE'].to_numpy(dtype=float) - self.bounds['west']) / res)
+        inside = (rows >= 0) & (rows < n_rows) & (cols >= 0) & (cols < n_cols)
+        state_idx = np.full(len(df), -1, dtype=np.intp)
+        state_idx[inside] = self._state_grid[rows[inside].astype(np.intp), cols[inside].astype(np.intp)]
+        
+        # Index -1 (outside every state) lands on the trailing 'Unknown'
+        state_ids = np.append(self.states_gdf['id'].to_numpy(dtype=object), 'Unknown')
+        state_idx[state_idx < 0] = len(state_ids) - 1
+        df['state'] = pd.Categorical.from_codes(state_idx, state_ids)
         return df
     
     def load_raw_data(self, force_reload: bool = False) -> None:
@@ -98,13 +196,12 @@ class DataManager:
         Args:
             force_reload: If True, bypass cache and reload from source files
         """
-        cache_file = self.cache_dir / "raw_data.pkl"
+        cache_file = self.cache_dir / "raw_data.parquet"
         
         if not force_reload and cache_file.exists():
             logging.info("Loading data from cache...")
             try:
-                with open(cache_file, 'rb') as f:
-                    self.raw_data = pickle.load(f)
+                self.raw_data = pd.read_parquet(cache_file, engine='pyarrow')
                 logging.info(f"Loaded {len(self.raw_data):,} records from cache")
                 return
             except Exception as e:
@@ -115,23 +212,45 @@ class DataManager:
         if not shapefiles:
             raise FileNotFoundError("No shapefiles found in data directory")
         
-        # Load and combine data from all shapefiles
+        # Load and combine data from all shapefiles. pyogrio reads through
+        # GDAL directly, projecting to the used fields and applying the North
+        # America bounds in the driver; fires are located by their LATITUDE
+        # and LONGITUDE attributes, so geometries are not read. Files are
+        # independent, so they are read in parallel worker processes.
+        bbox = (self.bounds['west'], self.bounds['south'], self.bounds['east'], self.bounds['north'])
         all_data = []
-        for shp in shapefiles:
-            try:
-                gdf = gpd.read_file(shp)
-                all_data.append(gdf)
-            except Exception as e:
-                logging.error(f"Error reading {shp}: {e}")
+        with ProcessPoolExecutor(max_workers=min(len(shapefiles), os.cpu_count() or 1)) as ex:
+            for df, error in ex.map(partial(_read_shapefile, bbox=bbox), shapefiles):
+                if error is not None:
+                    logging.error(error)
+                else:
+                    all_data.append(df)
         
         if not all_data:
             raise ValueError("No data could be loaded from shapefiles")
         
         self.raw_data = pd.concat(all_data, ignore_index=True)
+        all_data.clear()
         
-        # Cache the raw data
-        with open(cache_file, 'wb') as f:
-            pickle.dump(self.raw_data, f)
+        # Columns typed differently across sources (MODIS numeric vs VIIRS
+        # l/n/h CONFIDENCE) concatenate to mixed object columns, which Arrow
+        # can't store; keep their values as text (clean_data coerces them)
+        for col in self.raw_data.columns:
+            if self.raw_data[col].dtype == object:
+                self.raw_data[col] = self.raw_data[col].map(str, na_action='ignore')
+        
+        # Cache the raw data; the cache is an optimization, so a failed
+        # write is logged rather than aborting the load
+        try:
+            self.raw_data.to_parquet(
+                cache_file,
+                engine='pyarrow',
+                compression='zstd',
+                row_group_size=100_000
+            )
+        except Exception as e:
+            logging.error(f"Error writing cache: {e}")
+            cache_file.unlink(missing_ok=True)
         
         logging.info(f"Loaded {len(self.raw_data):,} raw records")
     
@@ -141,56 +260,80 @@ class DataManager:
             raise ValueError("No raw data loaded. Call load_raw_data() first.")
         
         logging.info("Cleaning data...")
-        df = self.raw_data.copy()
-        
-        # Convert dates
-        df['datetime'] = pd.to_datetime(df['ACQ_DATE'])
-        df['year'] = df['datetime'].dt.year
-        df['month'] = df['datetime'].dt.month
-        
-        # Filter to North America
-        mask = (
-            (df['LATITUDE'] >= self.bounds['south']) & 
-            (df['LATITUDE'] <= self.bounds['north']) & 
-            (df['LONGITUDE'] >= self.bounds['west']) & 
-            (df['LONGITUDE'] <= self.bounds['east']) &
-            (df['LATITUDE'].notna()) & 
-            (df['LONGITUDE'].notna())
-        )
-        df = df[mask]
-        
-        # Clean numeric columns
+        raw = self.raw_data
+        
+        # Every row filter below is computed as a mask on the raw arrays; the
+        # frame itself is only copied once, for the surviving rows
+        
+        # Filter to North America with one boolean array built in place on
+        # the raw coordinates (NaN fails every comparison, so missing
+        # coordinates are dropped too)
+        lat = raw['LATITUDE'].to_numpy(dtype=float)
+        lon = raw['LONGITUDE'].to_numpy(dtype=float)
+        mask = lat >= self.bounds['south']
+        mask &= lat <= self.bounds['north']
+        mask &= lon >= self.bounds['west']
+        mask &= lon <= self.bounds['east']
+        
+        # Clean numeric columns; columns already read as numbers (the usual
+        # case with Arrow reads) skip the per-value coercion
         numeric_cols = ['BRIGHTNESS', 'SCAN', 'TRACK', 'CONFIDENCE']
-        for col in numeric_cols:
-            df[col] = pd.to_numeric(df[col], errors='coerce')
+        numeric = {
+            col: raw[col] if pd.api.types.is_numeric_dtype(raw[col])
+            else pd.to_numeric(raw[col], errors='coerce')
+            for col in numeric_cols
+        }
         
         # Remove invalid measurements
-        df = df.dropna(subset=['BRIGHTNESS', 'SCAN', 'TRACK'])
-        
-        # Remove outliers using IQR method
-        for col in ['BRIGHTNESS', 'SCAN', 'TRACK']:
-            Q1 = df[col].quantile(0.25)
-            Q3 = df[col].quantile(0.75)
+        measured = np.column_stack([
+            numeric[col].to_numpy(dtype=float) for col in MEASUREMENT_COLUMNS
+        ])
+        mask &= ~np.isnan(measured).any(axis=1)
+        
+        # Remove outliers using IQR method: quartiles of all three columns in
+        # one call over the rows kept so far, then a single combined row mask
+        # (nothing to take quartiles of if no rows are left)
+        values = measured[mask]
+        rows = np.flatnonzero(mask)
+        if len(values):
+            Q1, Q3 = np.quantile(values, [0.25, 0.75], axis=0)
             IQR = Q3 - Q1
-            df = df[
-                (df[col] >= Q1 - 1.5 * IQR) & 
-                (df[col] <= Q3 + 1.5 * IQR)
-            ]
+            rows = rows[(
+                (values >= Q1 - 1.5 * IQR) & 
+                (values <= Q3 + 1.5 * IQR)
+            ).all(axis=1)]
+        
+        # Convert dates for the surviving rows only, and fold the sort by
+        # datetime into the same row selection
+        datetimes = pd.to_datetime(raw['ACQ_DATE'].iloc[rows]).to_numpy()
+        order = np.argsort(datetimes, kind='stable')
+        rows = rows[order]
+        
+        df = raw.take(rows)
+        for col in numeric_cols:
+            df[col] = numeric[col].to_numpy()[rows]
+        for col in MEASUREMENT_COLUMNS + ['LATITUDE', 'LONGITUDE']:
+            df[col] = df[col].astype(np.float32)
+        df['datetime'] = datetimes[order]
+        df['year'] = df['datetime'].dt.year.astype(np.int16)
+        df['month'] = df['datetime'].dt.month.astype(np.int8)
         
         # Calculate fire area and intensity metrics
         df['fire_area'] = df['SCAN'] * df['TRACK']
-        df['intensity'] = (df['BRIGHTNESS'] - df['BRIGHTNESS'].mean()) / df['BRIGHTNESS'].std()
+        df['intensity'] = (
+            (df['BRIGHTNESS'] - df['BRIGHTNESS'].mean()) / df['BRIGHTNESS'].std()
+        ).astype(np.float32)
         
         # Add seasonal information
-        df['season'] = df['month'].map(lambda m: next(
-            season for season, months in self.seasons.items() 
-            if m in months
-        ))
+        df['season'] = pd.Categorical.from_codes(
+            MONTH_TO_SEASON_CODE[df['month'].to_numpy()],
+            categories=list(self.seasons)
+        )
         
         # Add state information
         df = self._assign_states(df)
         
-        self.processed_data = df.sort_values('datetime')
+        self.processed_data = df
         logging.info(f"Cleaned data: {len(self.processed_data):,} records remaining")
     
     def get_seasonal_aggregation(self) -> pd.DataFrame:
@@ -203,7 +346,7 @@ class DataManager:
         if self.processed_data is None:
             raise ValueError("No processed data available. Run clean_data() first.")
         
-        seasonal = self.processed_data.groupby(['year', 'season']).agg({
+        seasonal = self.processed_data.groupby(['year', 'season'], observed=True).agg({
             'BRIGHTNESS': ['mean', 'max', 'count'],
             'fire_area': ['sum', 'mean'],
             'intensity': ['mean', 'max']
@@ -233,22 +376,36 @@ class DataManager:
         if self.processed_data is None:
             raise ValueError("No processed data available. Run clean_data() first.")
         
-        cache_file = self.cache_dir / "processed_data.pkl"
-        with open(cache_file, 'wb') as f:
-            pickle.dump(self.processed_data, f)
+        cache_file = self.cache_dir / "processed_data.parquet"
+        self.processed_data.to_parquet(
+            cache_file,
+            engine='pyarrow',
+            compression='zstd',
+            row_group_size=100_000
+        )
         logging.info(f"Saved processed data to {cache_file}")
     
-    def load_processed_data(self) -> Optional[pd.DataFrame]:
+    def load_processed_data(
+        self,
+        columns: Optional[List[str]] = None,
+        filters: Optional[List[Tuple]] = None
+    ) -> Optional[pd.DataFrame]:
         """
         Load processed data from cache
         
+        Args:
+            columns: Columns to read (default: all)
+            filters: pyarrow row filters, e.g. [('year', '>=', 2015)];
+                row groups whose statistics rule them out are skipped
+        
         Returns:
             Processed DataFrame if available, None otherwise
         """
-        cache_file = self.cache_dir / "processed_data.pkl"
+        cache_file = self.cache_dir / "processed_data.parquet"
         if cache_file.exists():
-            with open(cache_file, 'rb') as f:
-                self.processed_data = pickle.load(f)
+            self.processed_data = pd.read_parquet(
+                cache_file, engine='pyarrow', columns=columns, filters=filters
+            )
             logging.info(f"Loaded processed data: {len(self.processed_data):,} records")
             return self.processed_data
         return None 
\ No newline at end of file
@@ -7,6 +7,176 @@ import numpy as np
 from typing import Dict, List, Tuple, Union
 from .config import BOUNDS, COLUMNS
 
+# Confidence buckets; ordered like the pd.qcut labels they replace, and built
+# once so each Categorical shares the same categories
+CONFIDENCE_LEVELS = pd.CategoricalDtype(['low', 'medium', 'high'], ordered=True)
+
+def _quartiles(values: np.ndarray) -> Tuple[float, float]:
+    """
+    First and third quartiles of a NaN-free array
+    
+    Same linear interpolation as np.percentile, found by partitioning the
+    array in place around the four order statistics involved (O(n)) rather
+    than through the general percentile machinery.
+    
+    Args:
+        values: 1-D float array; reordered in place
+    
+    Returns:
+        Tuple of (Q1, Q3)
+    """
+    positions = np.array([0.25, 0.75]) * (len(values) - 1)
+    lower = np.floor(positions).astype(np.intp)
+    upper = np.minimum(lower + 1, len(values) - 1)
+    values.partition(np.unique(np.concatenate([lower, upper])))
+    q1, q3 = values[lower] + (values[upper] - values[lower]) * (positions - lower)
+    return q1, q3
+
+def _parse_dates(values: pd.Series) -> pd.Series:
+    """
+    Parse date values, invalid ones becoming NaT
+    
+    The FIRMS ACQ_DATE format goes through the fast C parser; only values
+    not in that format go through the general parser.
+    """
+    dates = pd.to_datetime(values, format='%Y-%m-%d', errors='coerce', cache=True)
+    unparsed = dates.isna() & values.notna()
+    if unparsed.any():
+        dates[unparsed] = pd.to_datetime(values[unparsed], errors='coerce')
+    return dates
+
+class ValidationPipeline:
+    """
+    Chained coordinate, numeric and date validation with one final take
+    
+    Each step only narrows a cumulative index of surviving row positions
+    instead of building a new DataFrame. Columns converted along the way are
+    kept aligned with that index, and the frame is taken once by result().
+    validate_coordinates, validate_numeric_columns and validate_dates are
+    single steps of it; steps return the pipeline, so they chain:
+    
+        df, stats = (ValidationPipeline(df)
+                     .coordinates()
+                     .numeric_columns(['BRIGHTNESS', 'SCAN', 'TRACK'])
+                     .dates()
+                     .result())
+    """
+    
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+        self.keep = np.arange(len(df))
+        self.columns = {}
+        self.stats = {}
+    
+    def _values(self, col: str, dtype=float) -> np.ndarray:
+        """Values of ``col`` at the kept rows (converted values if any)"""
+        if col in self.columns:
+            return self.columns[col]
+        return self.df[col].to_numpy(dtype=dtype, na_value=np.nan)[self.keep]
+    
+    def _narrow(self, mask: np.ndarray) -> None:
+        """Drop the kept rows where ``mask`` is False"""
+        self.keep = self.keep[mask]
+        for col, values in self.columns.items():
+            self.columns[col] = values[mask]
+    
+    def coordinates(
+        self,
+        lat_col: str = 'LATITUDE',
+        lon_col: str = 'LONGITUDE'
+    ) -> 'ValidationPipeline':
+        """Keep rows with coordinates inside BOUNDS (missing ones fail too)"""
+        stats = {'original_rows': len(self.keep)}
+        lat = self._values(lat_col)
+        lon = self._values(lon_col)
+        
+        valid_coords = np.count_nonzero(~np.isnan(lat) & ~np.isnan(lon))
+        stats['missing_coordinates'] = stats['original_rows'] - valid_coords
+        
+        valid = (
+            (lat >= BOUNDS['south']) & 
+            (lat <= BOUNDS['north']) & 
+            (lon >= BOUNDS['west']) & 
+            (lon <= BOUNDS['east'])
+        )
+        stats['out_of_bounds'] = valid_coords - np.count_nonzero(valid)
+        
+        self._narrow(valid)
+        self.stats['coordinates'] = stats
+        return self
+    
+    def numeric_columns(self, columns: List[str]) -> 'ValidationPipeline':
+        """
+        Coerce numeric columns to float32 and drop missing, non-positive
+        (BRIGHTNESS, SCAN, TRACK) and IQR outlier values
+        
+        Each column's quartiles are taken over the rows still kept after the
+        columns before it.
+        """
+        original_rows = len(self.keep)
+        stats = {col: {'original_rows': original_rows} for col in columns}
+        keep = np.ones(original_rows, dtype=bool)
+        
+        for col in columns:
+            if col not in self.df.columns:
+                continue
+            
+            # Only the kept rows are converted
+            values = pd.to_numeric(
+                self.df[col].take(self.keep), errors='coerce', downcast='float'
+            ).to_numpy(dtype=np.float32, na_value=np.nan)
+            self.columns[col] = values
+            
+            keep &= ~np.isnan(values)
+            stats[col]['missing_values'] = original_rows - np.count_nonzero(keep)
+            
+            if col in ['BRIGHTNESS', 'SCAN', 'TRACK']:
+                keep &= values > 0
+                stats[col]['negative_values'] = original_rows - \
+                                              stats[col]['missing_values'] - np.count_nonzero(keep)
+            
+            if keep.any():
+                Q1, Q3 = _quartiles(values[keep])
+                IQR = Q3 - Q1
+                keep &= (values >= Q1 - 1.5 * IQR) & (values <= Q3 + 1.5 * IQR)
+            stats[col]['outliers'] = original_rows - \
+                                    stats[col]['missing_values'] - \
+                                    stats[col].get('negative_values', 0) - \
+                                    np.count_nonzero(keep)
+        
+        self._narrow(keep)
+        self.stats['numeric'] = stats
+        return self
+    
+    def dates(self, date_col: str = 'ACQ_DATE') -> 'ValidationPipeline':
+        """Parse dates into 'datetime', dropping missing and future ones"""
+        stats = {'original_rows': len(self.keep)}
+        datetimes = _parse_dates(self.df[date_col].take(self.keep)).to_numpy()
+        
+        valid = ~np.isnat(datetimes)
+        stats['invalid_dates'] = stats['original_rows'] - np.count_nonzero(valid)
+        
+        # NaT compares False, so this mask drops missing dates as well
+        valid_timeframe = datetimes <= np.datetime64(pd.Timestamp.now())
+        stats['future_dates'] = np.count_nonzero(valid) - np.count_nonzero(valid_timeframe)
+        
+        self.columns['datetime'] = datetimes
+        self._narrow(valid_timeframe)
+        self.stats['dates'] = stats
+        return self
+    
+    def result(self) -> Tuple[pd.DataFrame, Dict[str, Dict]]:
+        """
+        Take the surviving rows once
+        
+        Returns:
+            Tuple of (cleaned DataFrame with converted columns, stats per step)
+        """
+        df = self.df.take(self.keep)
+        for col, values in self.columns.items():
+            df[col] = values
+        return df, self.stats
+
 def validate_coordinates(
     df: pd.DataFrame,
     lat_col: str = 'LATITUDE',
@@ -23,24 +193,8 @@ def validate_coordinates(
     Returns:
         Tuple of (cleaned DataFrame, validation stats)
     """
-    stats = {'original_rows': len(df)}
-    
-    # Check for missing coordinates
-    valid_coords = df[lat_col].notna() & df[lon_col].notna()
-    df = df[valid_coords]
-    stats['missing_coordinates'] = stats['original_rows'] - len(df)
-    
-    # Check coordinate bounds
-    valid_bounds = (
-        (df[lat_col] >= BOUNDS['south']) & 
-        (df[lat_col] <= BOUNDS['north']) & 
-        (df[lon_col] >= BOUNDS['west']) & 
-        (df[lon_col] <= BOUNDS['east'])
-    )
-    df = df[valid_bounds]
-    stats['out_of_bounds'] = stats['original_rows'] - stats['missing_coordinates'] - len(df)
-    
-    return df, stats
+    df, stats = ValidationPipeline(df).coordinates(lat_col, lon_col).result()
+    return df, stats['coordinates']
 
 def validate_numeric_columns(
     df: pd.DataFrame,
@@ -56,42 +210,8 @@ def validate_numeric_columns(
     Returns:
         Tuple of (cleaned DataFrame, validation stats)
     """
-    stats = {col: {'original_rows': len(df)} for col in columns}
-    
-    for col in columns:
-        if col not in df.columns:
-            continue
-            
-        # Convert to numeric
-        df[col] = pd.to_numeric(df[col], errors='coerce')
-        
-        # Check for missing values
-        valid_values = df[col].notna()
-        df = df[valid_values]
-        stats[col]['missing_values'] = stats[col]['original_rows'] - len(df)
-        
-        # Remove negative values for certain metrics
-        if col in ['BRIGHTNESS', 'SCAN', 'TRACK']:
-            valid_positive = df[col] > 0
-            df = df[valid_positive]
-            stats[col]['negative_values'] = stats[col]['original_rows'] - \
-                                          stats[col]['missing_values'] - len(df)
-        
-        # Remove outliers using IQR method
-        Q1 = df[col].quantile(0.25)
-        Q3 = df[col].quantile(0.75)
-        IQR = Q3 - Q1
-        valid_range = (
-            (df[col] >= Q1 - 1.5 * IQR) & 
-            (df[col] <= Q3 + 1.5 * IQR)
-        )
-        df = df[valid_range]
-        stats[col]['outliers'] = stats[col]['original_rows'] - \
-                                stats[col]['missing_values'] - \
-                                stats[col].get('negative_values', 0) - \
-                                len(df)
-    
-    return df, stats
+    df, stats = ValidationPipeline(df).numeric_columns(columns).result()
+    return df, stats['numeric']
 
 def validate_dates(
     df: pd.DataFrame,
@@ -107,22 +227,8 @@ def validate_dates(
     Returns:
         Tuple of (cleaned DataFrame, validation stats)
     """
-    stats = {'original_rows': len(df)}
-    
-    # Convert to datetime
-    df['datetime'] = pd.to_datetime(df[date_col], errors='coerce')
-    
-    # Remove missing dates
-    valid_dates = df['datetime'].notna()
-    df = df[valid_dates]
-    stats['invalid_dates'] = stats['original_rows'] - len(df)
-    
-    # Remove future dates
-    valid_timeframe = df['datetime'] <= pd.Timestamp.now()
-    df = df[valid_timeframe]
-    stats['future_dates'] = stats['original_rows'] - stats['invalid_dates'] - len(df)
-    
-    return df, stats
+    df, stats = ValidationPipeline(df).dates(date_col).result()
+    return df, stats['dates']
 
 def validate_required_columns(df: pd.DataFrame) -> Tuple[bool, List[str]]:
     """
@@ -149,18 +255,21 @@ def compute_derived_fields(df: pd.DataFrame) -> pd.DataFrame:
     """
     # Calculate fire area
     if all(col in df.columns for col in ['SCAN', 'TRACK']):
-        df['fire_area'] = df['SCAN'] * df['TRACK']
+        df['fire_area'] = df['SCAN'].astype(np.float32) * df['TRACK'].astype(np.float32)
     
     # Calculate normalized intensity
     if 'BRIGHTNESS' in df.columns:
-        df['intensity'] = (df['BRIGHTNESS'] - df['BRIGHTNESS'].mean()) / df['BRIGHTNESS'].std()
+        df['intensity'] = (
+            (df['BRIGHTNESS'] - df['BRIGHTNESS'].mean()) / df['BRIGHTNESS'].std()
+        ).astype(np.float32)
     
-    # Add confidence level if available
+    # Add confidence level if available: tercile edges, then right-closed
+    # buckets as pd.qcut would give (missing values get code -1, i.e. NaN)
     if 'CONFIDENCE' in df.columns:
-        df['confidence_level'] = pd.qcut(
-            df['CONFIDENCE'],
-            q=3,
-            labels=['low', 'medium', 'high']
-        )
+        confidence = df['CONFIDENCE'].to_numpy(dtype=float, na_value=np.nan)
+        edges = np.nanquantile(confidence, [1 / 3, 2 / 3])
+        codes = np.searchsorted(edges, confidence, side='left').astype(np.int8)
+        codes[np.isnan(confidence)] = -1
+        df['confidence_level'] = pd.Categorical.from_codes(codes, dtype=CONFIDENCE_LEVELS)
     
     return df 
\ No newline at end of file
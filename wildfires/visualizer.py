@@ -8,10 +8,63 @@ from folium.plugins import HeatMap, TimestampedGeoJson
 import pandas as pd
 import numpy as np
 from pathlib import Path
+import base64
+import copy
+import hashlib
+import io
+import json
 import logging
+import orjson
+import requests
+from functools import lru_cache
+from string import Template
 from typing import Optional, Dict, List, Tuple
-from .config import VIS_SETTINGS, PERFORMANCE, BOUNDS
-from .data_manager import DataManager
+from .config import VIS_SETTINGS, PERFORMANCE, BOUNDS, MONTH_TO_SEASON_LUT
+from .data_manager import DataManager, STATES_URL
+
+# Marker colors by normalized intensity: below 0.33, below 0.66, the rest
+INTENSITY_EDGES = np.array([0.33, 0.66])
+INTENSITY_COLORS = np.array([
+    VIS_SETTINGS['colors']['low_intensity'],
+    VIS_SETTINGS['colors']['medium_intensity'],
+    VIS_SETTINGS['colors']['high_intensity']
+], dtype=object)
+INTENSITY_RGB = np.array(
+    [[int(color[i:i + 2], 16) for i in (1, 3, 5)] for color in INTENSITY_COLORS],
+    dtype=np.uint8
+)
+
+# Page for create_visualization_gpu, filled in with string.Template
+DECK_TEMPLATE = Path(__file__).parent / "templates" / "deck_visualization.html"
+
+# Bump when _aggregate_by_location_and_season's output changes, so cached
+# aggregations from older code are not reused
+AGGREGATION_VERSION = 3
+
+# Number of cached aggregations kept on disk (least recently used go first)
+AGGREGATION_CACHE_ENTRIES = 8
+
+# Columns the aggregation reads; their contents key the cache
+AGGREGATION_INPUTS = [
+    'year', 'season', 'period_start', 'datetime', 'LATITUDE', 'LONGITUDE',
+    'BRIGHTNESS', 'fire_area', 'intensity', 'state'
+]
+
+@lru_cache(maxsize=None)
+def _load_states_geojson(cache_file: Path) -> Dict:
+    """
+    Parsed US states GeoJSON, downloaded once into ``cache_file``
+    
+    Memoized per path so every visualizer in the process shares one parse;
+    callers must copy it before handing it to folium, which writes styles
+    into the feature properties.
+    """
+    if not cache_file.exists():
+        response = requests.get(STATES_URL, timeout=30)
+        response.raise_for_status()
+        cache_file.write_bytes(response.content)
+    with open(cache_file, encoding='utf-8') as f:
+        return json.load(f)
 
 class FireVisualizer:
     def __init__(self, data_manager: Optional[DataManager] = None):
@@ -39,10 +92,28 @@ class FireVisualizer:
             'Fall': [9, 10, 11]
         }
         
+        # First month of each month's season, indexed by month number
+        self.period_month = np.zeros(13, dtype=np.int64)
+        for months in self.seasons.values():
+            self.period_month[months] = months[0]
+        
+        # State boundaries, fetched once and reused by every map layer
+        try:
+            self._states_geojson = _load_states_geojson(self.data_manager.cache_dir / "us-states.json")
+        except Exception as e:
+            logging.error(f"Error loading states GeoJSON, layers will fetch it directly: {e}")
+            self._states_geojson = None
+        
         # Constants for size scaling
         self.EARTH_RADIUS_KM = 6371  # Earth's radius in kilometers
         self.PIXELS_PER_KM = 0.05  # Reduced base scale for better visibility
     
+    def _states_geo_data(self):
+        """States GeoJSON for one folium layer (a private copy, or the URL)"""
+        if self._states_geojson is None:
+            return STATES_URL
+        return copy.deepcopy(self._states_geojson)
+    
     def _create_base_map(self) -> folium.Map:
         """Create the base map with initial configuration"""
         m = folium.Map(
@@ -55,7 +126,7 @@ class FireVisualizer:
         
         # Add state/province boundaries for context
         folium.GeoJson(
-            'https://raw.githubusercontent.com/python-visualization/folium/master/examples/data/us-states.json',
+            self._states_geo_data(),
             style_function=lambda x: {
                 'fillColor': 'transparent',
                 'color': '#666',
@@ -65,18 +136,15 @@ class FireVisualizer:
         
         return m
     
-    def _add_state_choropleth(self, state_data: List[Dict]) -> None:
+    def _add_state_choropleth(self, state_df: pd.DataFrame) -> None:
         """Add state-level choropleth layer"""
-        # Convert state data to proper format for choropleth
-        state_df = pd.DataFrame(state_data)
-        
         # Convert fire area to numeric and handle any missing values
         state_df['fire_area'] = pd.to_numeric(state_df['fire_area'], errors='coerce')
         state_df = state_df.dropna()
         
         # Create choropleth layer for fire area
         folium.Choropleth(
-            geo_data='https://raw.githubusercontent.com/python-visualization/folium/master/examples/data/us-states.json',
+            geo_data=self._states_geo_data(),
             name='Fire Area Heat Map',
             data=state_df,
             columns=['state', 'fire_area'],
@@ -100,12 +168,14 @@ class FireVisualizer:
                                       'weight': 0.1}
         
         # Create tooltip HTML with both area and count
-        state_info = {}
-        for _, row in state_df.iterrows():
-            state_info[row['state']] = {
-                'area': f"{row['fire_area']:,.0f}",
-                'count': f"{row['fire_count']:,}"
-            }
+        state_info = {
+            state: {'area': area, 'count': count}
+            for state, area, count in zip(
+                state_df['state'],
+                state_df['fire_area'].map('{:,.0f}'.format),
+                state_df['fire_count'].map('{:,}'.format)
+            )
+        }
         
         def tooltip_html(feature):
             state_id = feature['id']
@@ -121,7 +191,7 @@ class FireVisualizer:
             return feature['properties']['name']
         
         NIL = folium.features.GeoJson(
-            'https://raw.githubusercontent.com/python-visualization/folium/master/examples/data/us-states.json',
+            self._states_geo_data(),
             style_function=style_function,
             control=False,
             highlight_function=highlight_function,
@@ -134,87 +204,108 @@ class FireVisualizer:
         self.map.add_child(NIL)
         self.map.keep_in_front(NIL)
     
-    def _calculate_pixel_radius(self, area_km2: float, latitude: float, zoom: int) -> float:
+    def _calculate_pixel_radius(self, area_km2, latitude, zoom: int):
         """
-        Calculate the pixel radius for a fire based on its actual area
+        Calculate the pixel radius for fires based on their actual area
         
         Args:
-            area_km2: Fire area in square kilometers
-            latitude: Latitude of the fire (for Mercator projection correction)
+            area_km2: Fire area(s) in square kilometers (scalar or array)
+            latitude: Latitude(s) of the fire (for Mercator projection correction)
             zoom: Current zoom level
         
         Returns:
-            Radius in pixels
+            Radius in pixels, same shape as the inputs
         """
-        # Convert area to radius in km (assuming circular fire)
-        radius_km = np.sqrt(area_km2 / np.pi)
-        
-        # Correct for Mercator projection distortion
-        lat_rad = np.radians(latitude)
-        mercator_correction = np.cos(lat_rad)
-        
         # Convert to pixels with zoom scaling
         # At zoom level 0, one pixel represents 156.543 km at the equator
         # Each zoom level doubles the number of pixels
         km_per_pixel = 156.543 / (2 ** zoom)
-        pixel_radius = (radius_km * mercator_correction) / km_per_pixel * self.PIXELS_PER_KM
+        
+        # Radius in km of a circular fire is sqrt(area / pi); that, the pixel
+        # conversion and the base scale fold into one scalar factor
+        scale = self.PIXELS_PER_KM / (km_per_pixel * np.sqrt(np.pi))
+        
+        # Correct for Mercator projection distortion; the arithmetic runs in
+        # place on one float64 buffer
+        pixel_radius = np.array(latitude, dtype=float)
+        np.radians(pixel_radius, out=pixel_radius)
+        np.cos(pixel_radius, out=pixel_radius)
+        pixel_radius *= np.sqrt(np.asarray(area_km2, dtype=float))
+        pixel_radius *= scale
         
         # Apply minimum and maximum limits
         return np.clip(pixel_radius, 
                       VIS_SETTINGS['fire_markers']['min_radius'],
-                      VIS_SETTINGS['fire_markers']['max_radius'])
+                      VIS_SETTINGS['fire_markers']['max_radius'],
+                      out=pixel_radius)
     
-    def _create_fire_feature(self, row: pd.Series, base_zoom: int = 4) -> Dict:
-        """Create a GeoJSON feature for a single fire record"""
-        # Calculate normalized intensity (0-1 scale)
-        intensity = (row['intensity'] - self.intensity_min) / (self.intensity_max - self.intensity_min)
-        intensity = max(0, min(1, intensity))  # Clip to [0,1]
-        
-        # Determine color based on intensity
-        if intensity < 0.33:
-            color = VIS_SETTINGS['colors']['low_intensity']
-        elif intensity < 0.66:
-            color = VIS_SETTINGS['colors']['medium_intensity']
-        else:
-            color = VIS_SETTINGS['colors']['high_intensity']
+    def _intensity_codes(self, intensity: np.ndarray) -> np.ndarray:
+        """Color bucket (index into INTENSITY_COLORS) of each intensity"""
+        # Calculate normalized intensity (0-1 scale) for the whole column
+        intensity_norm = np.clip(
+            (intensity - self.intensity_min) / (self.intensity_max - self.intensity_min), 0, 1
+        )
+        
+        # Branchless compare against the edges
+        return np.digitize(intensity_norm, INTENSITY_EDGES).astype(np.uint8)
+    
+    def _create_fire_features(self, group: pd.DataFrame, base_zoom: int = 4) -> List[Dict]:
+        """Create GeoJSON features for all fire records in a frame"""
+        # Determine color based on intensity bucket
+        intensity = group['intensity'].to_numpy(dtype=float)
+        colors = INTENSITY_COLORS[self._intensity_codes(intensity)]
         
         # Calculate radius based on actual fire area
-        radius = self._calculate_pixel_radius(row['fire_area'], row['LATITUDE'], base_zoom)
-        
-        return {
-            'type': 'Feature',
-            'geometry': {
-                'type': 'Point',
-                'coordinates': [float(row['LONGITUDE']), float(row['LATITUDE'])]
-            },
-            'properties': {
-                'time': row['period_start'].strftime('%Y-%m-%d'),
-                'style': {
-                    'color': color,
-                    'fillColor': color,
-                    'fillOpacity': VIS_SETTINGS['fire_markers']['base_opacity'],
-                    'weight': 1,
-                    'radius': radius
+        lat = group['LATITUDE'].to_numpy(dtype=float)
+        lon = group['LONGITUDE'].to_numpy(dtype=float)
+        radii = self._calculate_pixel_radius(group['fire_area'].to_numpy(dtype=float), lat, base_zoom)
+        
+        times = group['period_start'].dt.strftime('%Y-%m-%d').to_numpy()
+        opacity = VIS_SETTINGS['fire_markers']['base_opacity']
+        
+        return [
+            {
+                'type': 'Feature',
+                'geometry': {
+                    'type': 'Point',
+                    'coordinates': [x, y]
                 },
-                'icon': 'circle',
-                'popup': (
-                    f"<div style='font-family: Arial; font-size: 12px;'>"
-                    f"<b>Fire Activity</b><br>"
-                    f"Period: {row['season']} {row['year']}<br>"
-                    f"Average Temperature: {row['BRIGHTNESS']:.1f}K<br>"
-                    f"Total Area: {row['fire_area']:.2f} km²<br>"
-                    f"Intensity: {row['intensity']:.2f}<br>"
-                    f"Fires in Location: {int(row['fire_count']):,}"
-                    f"</div>"
-                )
+                'properties': {
+                    'time': time,
+                    'style': {
+                        'color': color,
+                        'fillColor': color,
+                        'fillOpacity': opacity,
+                        'weight': 1,
+                        'radius': radius
+                    },
+                    'icon': 'circle',
+                    'popup': (
+                        f"<div style='font-family: Arial; font-size: 12px;'>"
+                        f"<b>Fire Activity</b><br>"
+                        f"Period: {season} {year}<br>"
+                        f"Average Temperature: {brightness:.1f}K<br>"
+                        f"Total Area: {area:.2f} km²<br>"
+                        f"Intensity: {raw_intensity:.2f}<br>"
+                        f"Fires in Location: {count:,}"
+                        f"</div>"
+                    )
+                }
             }
-        }
+            for x, y, time, color, radius, season, year, brightness, area, raw_intensity, count in zip(
+                lon.tolist(), lat.tolist(), times, colors, radii.tolist(),
+                group['season'].tolist(), group['year'].tolist(),
+                group['BRIGHTNESS'].tolist(), group['fire_area'].tolist(),
+                intensity.tolist(), group['fire_count'].astype(int).tolist()
+            )
+        ]
     
-    def _aggregate_by_location_and_season(self, data: pd.DataFrame) -> Tuple[pd.DataFrame, Dict]:
+    def _aggregate_by_location_and_season(self, data: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
         """Aggregate data by unique location and season"""
-        # Round coordinates to reduce noise while maintaining distinct locations
-        data['LATITUDE_BIN'] = (data['LATITUDE'] * 10).round() / 10
-        data['LONGITUDE_BIN'] = (data['LONGITUDE'] * 10).round() / 10
+        # Round coordinates to reduce noise while maintaining distinct locations;
+        # bins are integer tenths of a degree, which hash faster than floats
+        data['LATITUDE_BIN'] = np.rint(data['LATITUDE'].to_numpy() * 10).astype(np.int16)
+        data['LONGITUDE_BIN'] = np.rint(data['LONGITUDE'].to_numpy() * 10).astype(np.int16)
         
         # Aggregate by location bins and season
         seasonal_data = data.groupby([
@@ -233,26 +324,70 @@ class FireVisualizer:
         # Rename count column to fire_count
         seasonal_data = seasonal_data.rename(columns={'datetime': 'fire_count'})
         
-        # Calculate state-level statistics
-        state_data = data.groupby('state').agg({
+        # Calculate state-level statistics (state is categorical; only states
+        # with fires get a row)
+        state_data = data.groupby('state', observed=True).agg({
             'fire_area': 'sum',
             'datetime': 'count'  # Use datetime for count
         }).reset_index()
         
-        # Rename count column and format for choropleth
+        # Rename count column for choropleth
         state_data = state_data.rename(columns={'datetime': 'fire_count'})
         
-        return seasonal_data, state_data.to_dict('records')
+        return seasonal_data, state_data
     
-    def create_visualization(self, output_file: str = "fire_visualization.html") -> None:
+    def _cached_aggregation(self, data: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
         """
-        Create an interactive visualization of fire data
+        _aggregate_by_location_and_season, cached on disk by input contents
         
-        Args:
-            output_file: Path to save the output HTML file
+        Results are stored as Parquet in the data manager's cache directory
+        under a hash of the aggregation's input columns; only the most
+        recently used AGGREGATION_CACHE_ENTRIES results are kept.
         """
-        logging.info("Creating visualization...")
+        cache_dir = self.data_manager.cache_dir / "seasonal"
+        digest = hashlib.blake2b(
+            pd.util.hash_pandas_object(data[AGGREGATION_INPUTS], index=False).to_numpy().tobytes(),
+            digest_size=8,
+            person=f"agg-v{AGGREGATION_VERSION}".encode()
+        ).hexdigest()
+        seasonal_file = cache_dir / f"seasonal_{digest}.parquet"
+        state_file = cache_dir / f"state_{digest}.parquet"
+        
+        if seasonal_file.exists() and state_file.exists():
+            try:
+                seasonal_data = pd.read_parquet(seasonal_file, engine='pyarrow')
+                state_data = pd.read_parquet(state_file, engine='pyarrow')
+                seasonal_file.touch()
+                logging.info(f"Loaded seasonal aggregation from {seasonal_file}")
+                return seasonal_data, state_data
+            except Exception as e:
+                logging.error(f"Error loading cached aggregation: {e}")
+        
+        seasonal_data, state_data = self._aggregate_by_location_and_season(data)
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            seasonal_data.to_parquet(seasonal_file, engine='pyarrow', index=False)
+            state_data.to_parquet(state_file, engine='pyarrow', index=False)
+            
+            # Evict the least recently used entries beyond the limit
+            entries = sorted(cache_dir.glob("seasonal_*.parquet"), key=lambda f: f.stat().st_mtime)
+            for stale in entries[:-AGGREGATION_CACHE_ENTRIES]:
+                stale.unlink(missing_ok=True)
+                (cache_dir / stale.name.replace("seasonal_", "state_", 1)).unlink(missing_ok=True)
+        except Exception as e:
+            logging.error(f"Error caching seasonal aggregation: {e}")
+        
+        return seasonal_data, state_data
+    
+    def _prepare_seasonal_data(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Load the processed data and aggregate it by location and season
+        
+        Also sets the global intensity/area ranges used for normalization.
         
+        Returns:
+            Tuple of (location-season records, state-level records)
+        """
         # Load data if not already loaded
         if self.data_manager.processed_data is None:
             self.data_manager.load_processed_data()
@@ -263,20 +398,21 @@ class FireVisualizer:
         data = self.data_manager.get_time_series()
         logging.info(f"Processing {len(data):,} fire records")
         
-        # Add season information
-        data['season'] = data['datetime'].dt.month.map(
-            lambda m: next(season for season, months in self.seasons.items() if m in months)
-        )
+        # Add season information (month-indexed lookup, no per-row callback)
+        months = data['datetime'].dt.month.to_numpy()
+        data['season'] = MONTH_TO_SEASON_LUT[months]
         data['year'] = data['datetime'].dt.year
         
-        # Create seasonal periods
-        data['period_start'] = data.apply(
-            lambda row: pd.Timestamp(f"{row['year']}-{self.seasons[row['season']][0]:02d}-01"),
-            axis=1
-        )
+        # Create seasonal periods, assembled from year/month/day columns in
+        # one vectorized call
+        data['period_start'] = pd.to_datetime(pd.DataFrame({
+            'year': data['year'],
+            'month': self.period_month[months],
+            'day': 1
+        }, index=data.index))
         
         # Aggregate data while maintaining location granularity
-        seasonal_data, state_data = self._aggregate_by_location_and_season(data)
+        seasonal_data, state_data = self._cached_aggregation(data)
         logging.info(f"Created {len(seasonal_data)} location-based seasonal records")
         
         # Calculate global statistics for normalization
@@ -285,31 +421,59 @@ class FireVisualizer:
         self.area_min = seasonal_data['fire_area'].min()
         self.area_max = seasonal_data['fire_area'].max()
         
+        return seasonal_data, state_data
+    
+    def _cap_frames(self, seasonal_data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Cap each (year, season) frame at PERFORMANCE['max_points_per_frame']
+        
+        The kept rows are a weighted sample (by intensity and area) drawn for
+        all frames at once: every row gets an exponential key scaled by
+        1/weight, and the smallest keys per frame are kept, which is weighted
+        sampling without replacement.
+        """
+        rng = np.random.default_rng(42)
+        weights = np.nan_to_num(
+            np.abs(seasonal_data['intensity'].to_numpy(dtype=float)) *
+            seasonal_data['fire_area'].to_numpy(dtype=float)
+        )
+        with np.errstate(divide='ignore'):
+            keys = rng.standard_exponential(len(seasonal_data)) / weights
+        rank = pd.Series(keys, index=seasonal_data.index).groupby(
+            [seasonal_data['year'], seasonal_data['season']]
+        ).rank(method='first')
+        return seasonal_data[rank.to_numpy() <= PERFORMANCE['max_points_per_frame']]
+    
+    def create_visualization(self, output_file: str = "fire_visualization.html") -> None:
+        """
+        Create an interactive visualization of fire data
+        
+        Args:
+            output_file: Path to save the output HTML file
+        """
+        logging.info("Creating visualization...")
+        
+        seasonal_data, state_data = self._prepare_seasonal_data()
+        
         # Create base map
         self.map = self._create_base_map()
         self._add_state_choropleth(state_data)
         
         # Create features for each location-season combination
-        features = []
-        for _, group in seasonal_data.groupby(['year', 'season']):
-            if len(group) > PERFORMANCE['max_points_per_frame']:
-                # Sample points, weighted by intensity and area
-                weights = group['intensity'].abs() * group['fire_area']
-                group = group.sample(
-                    n=PERFORMANCE['max_points_per_frame'],
-                    weights=weights,
-                    random_state=42
-                )
-            features.extend(self._create_fire_feature(row) for _, row in group.iterrows())
+        features = self._create_fire_features(self._cap_frames(seasonal_data))
         
         logging.info(f"Created {len(features)} visualization features")
         
-        # Add the time slider with fire points
+        # Add the time slider with fire points. The collection is encoded
+        # with orjson in one call and handed over as a file-like object,
+        # which folium embeds as is instead of re-serializing it
+        payload = orjson.dumps({
+            'type': 'FeatureCollection',
+            'features': features
+        })
+        del features
         TimestampedGeoJson(
-            {
-                'type': 'FeatureCollection',
-                'features': features
-            },
+            io.StringIO(payload.decode()),
             period='P3M',  # 3 months per period
             duration='P3M',  # Show each season for its full duration
             transition_time=VIS_SETTINGS['animation']['transition_time'],
@@ -330,6 +494,71 @@ class FireVisualizer:
         self.map.save(output_file)
         logging.info("Visualization created successfully!")
     
+    def create_visualization_gpu(self, output_file: str = "fire_visualization_gpu.html") -> None:
+        """
+        Create a WebGL (deck.gl) visualization of fire data
+        
+        Same frames and points as create_visualization, but the points are
+        written as packed little-endian typed arrays (base64) rendered by a
+        deck.gl ScatterplotLayer, with the season shown picked on the GPU by
+        a DataFilterExtension, so no per-point GeoJSON is built. The page is
+        filled in from templates/deck_visualization.html; deck.gl (from
+        VIS_SETTINGS['deck_gl']) and the state boundaries are fetched when
+        the page is opened.
+        
+        Args:
+            output_file: Path to save the output HTML file
+        """
+        logging.info("Creating GPU visualization...")
+        
+        seasonal_data, _ = self._prepare_seasonal_data()
+        points = self._cap_frames(seasonal_data)
+        
+        # One frame per season, in time order
+        frame_codes, _ = pd.factorize(points['period_start'], sort=True)
+        first = np.unique(frame_codes, return_index=True)[1]
+        labels = [
+            f"{season} {year}" for season, year in
+            zip(points['season'].to_numpy()[first], points['year'].to_numpy()[first])
+        ]
+        
+        lat = points['LATITUDE'].to_numpy(dtype=float)
+        lon = points['LONGITUDE'].to_numpy(dtype=float)
+        area = points['fire_area'].to_numpy(dtype=float)
+        radii = self._calculate_pixel_radius(area, lat, VIS_SETTINGS['map']['default_zoom'])
+        colors = INTENSITY_RGB[self._intensity_codes(points['intensity'].to_numpy(dtype=float))]
+        
+        def pack(values, dtype):
+            return base64.b64encode(np.ascontiguousarray(values, dtype=dtype).tobytes()).decode('ascii')
+        
+        payload = {
+            'length': len(points),
+            'labels': labels,
+            'positions': pack(np.column_stack([lon, lat]), '<f4'),
+            'colors': pack(colors, np.uint8),
+            'radii': pack(radii, '<f4'),
+            'frames': pack(frame_codes, '<f4'),
+            'areas': pack(area, '<f4'),
+            'counts': pack(points['fire_count'], '<i4'),
+            'states': STATES_URL,
+            'center': VIS_SETTINGS['map']['default_center'],
+            'zoom': VIS_SETTINGS['map']['default_zoom'],
+            'opacity': VIS_SETTINGS['fire_markers']['base_opacity'],
+            'interval': VIS_SETTINGS['animation']['transition_time']
+        }
+        logging.info(f"Packed {len(points):,} points in {len(labels)} frames")
+        
+        # Keep embedded strings from closing the script element
+        page = Template(DECK_TEMPLATE.read_text(encoding='utf-8')).substitute(
+            deck_gl_url=VIS_SETTINGS['deck_gl']['script_url'],
+            payload=json.dumps(payload).replace('</', '<\\/')
+        )
+        
+        logging.info(f"Saving GPU visualization to {output_file}...")
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(page)
+        logging.info("GPU visualization created successfully!")
+    
     def _add_playback_controls(self) -> None:
         """Add enhanced playback controls to the map"""
         playback_html = '''